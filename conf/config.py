@@ -4,6 +4,8 @@ import os
 import tempfile
 from typing import Any, Optional, Tuple, Union  # noqa
 
+from sqlalchemy.pool import StaticPool
+
 from freshmaker.config import all_, any_  # noqa
 
 # FIXME: workaround for this moment till confdir, dbdir (installdir etc.) are
@@ -28,6 +30,7 @@ class BaseConfiguration(object):
     # Global network-related values, in seconds
     NET_TIMEOUT = 120
     NET_RETRY_INTERVAL = 30
+    NET_RETRY_MAX_INTERVAL = 300
 
     SYSTEM = "koji"
 
@@ -236,6 +239,13 @@ class TestConfiguration(BaseConfiguration):
     FRESHMAKER_ROOT_URL = "https://localhost"  # Root url of Freshmaker's endpoints
 
     SQLALCHEMY_DATABASE_URI = "sqlite://"
+    # Share the single in-memory database across connections and threads;
+    # the default SingletonThreadPool would give every thread its own
+    # (empty) database.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
 
     MESSAGING = "in_memory"
     MESSAGING_SENDER = "in_memory"
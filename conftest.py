@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024  Red Hat, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+# Importing the tests package pulls in freshmaker.monitor, which points
+# prometheus_multiproc_dir at a private temporary directory. Under
+# pytest-xdist the workers inherit the directory the controller created,
+# prometheus_client then switches every metric to its multiprocess mmap
+# backend, and each worker's MultiProcessCollector reports every metric
+# family twice. Drop any inherited setting here - this conftest runs
+# before the tests package is imported - so each process creates its own
+# directory, exactly like a serial run does.
+os.environ.pop("prometheus_multiproc_dir", None)
+os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
@@ -44,6 +44,30 @@ except pkg_resources.DistributionNotFound:
 app = Flask(__name__)  # type: Any
 app.wsgi_app = ReverseProxy(app.wsgi_app)
 
+try:
+    import orjson
+
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson's C encoder.
+
+        Serializing API responses is where most of the time goes on the
+        listing endpoints once the query itself is cheap, so use orjson
+        when it is installed and fall back to Flask's pure-Python
+        provider otherwise.
+        """
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass
+
 conf = init_config(app)
 
 db = SQLAlchemy(app)  # type: Any
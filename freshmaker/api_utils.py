@@ -27,6 +27,17 @@ from freshmaker.errors import ValidationError
 from freshmaker.types import ArtifactType, ArtifactBuildState, EventState
 from freshmaker.models import ArtifactBuild, Event
 
+# Accepted "?type=" and "?state=" values, mapped to the enum value to
+# filter on. Precomputed once so validating a request is a single dict
+# lookup instead of scanning the enum members.
+_ARTIFACT_TYPE_MAP = {str(t.value): t.value for t in ArtifactType}
+_ARTIFACT_TYPE_MAP.update({t.name.lower(): t.value for t in ArtifactType})
+
+_BUILD_STATE_MAP = {str(s.value): s.value for s in ArtifactBuildState}
+_BUILD_STATE_MAP.update({s.name.lower(): s.value for s in ArtifactBuildState})
+
+_EVENT_STATE_NAME_MAP = {s.name.lower(): s.value for s in EventState}
+
 
 def pagination_metadata(p_query, request_args):
     """
@@ -129,29 +140,17 @@ def filter_artifact_builds(flask_request):
 
     artifact_type = flask_request.args.get("type", None)
     if artifact_type:
-        if artifact_type.isdigit():
-            if int(artifact_type) in [t.value for t in list(ArtifactType)]:
-                search_query["type"] = artifact_type
-            else:
-                raise ValueError("An invalid artifact type was supplied")
-        else:
-            if str(artifact_type).upper() in [t.name for t in list(ArtifactType)]:
-                search_query["type"] = ArtifactType[artifact_type.upper()].value
-            else:
-                raise ValueError("An invalid artifact type was supplied")
+        artifact_type_value = _ARTIFACT_TYPE_MAP.get(artifact_type.lower())
+        if artifact_type_value is None:
+            raise ValueError("An invalid artifact type was supplied")
+        search_query["type"] = artifact_type_value
 
     state = flask_request.args.get("state", None)
     if state:
-        if state.isdigit():
-            if int(state) in [s.value for s in list(ArtifactBuildState)]:
-                search_query["state"] = state
-            else:
-                raise ValueError("An invalid state was supplied")
-        else:
-            if str(state).upper() in [s.name for s in list(ArtifactBuildState)]:
-                search_query["state"] = ArtifactBuildState[state.upper()].value
-            else:
-                raise ValueError("An invalid state was supplied")
+        state_value = _BUILD_STATE_MAP.get(state.lower())
+        if state_value is None:
+            raise ValueError("An invalid state was supplied")
+        search_query["state"] = state_value
 
     for key in ["name", "event_id", "dep_on_id", "build_id", "original_nvr", "rebuilt_nvr"]:
         if flask_request.args.get(key, None):
@@ -159,9 +158,34 @@ def filter_artifact_builds(flask_request):
 
     query = ArtifactBuild.query
 
+    # With "fields" set, only the requested columns are fetched and
+    # serialized instead of full ArtifactBuild objects.
+    fields = flask_request.args.get("fields", None)
+    if fields:
+        columns = []
+        for field in fields.split(","):
+            if field not in ArtifactBuild.__table__.columns:
+                raise ValueError("An invalid fields value was supplied: %s" % field)
+            columns.append(getattr(ArtifactBuild, field))
+        query = query.with_entities(*columns)
+
     if search_query:
         query = query.filter_by(**search_query)
 
+    # "<key>__in" variants accept a comma-separated list of values and
+    # match any of them with a single query.
+    for key in ["name", "event_id", "dep_on_id", "build_id", "original_nvr", "rebuilt_nvr"]:
+        values = flask_request.args.get(key + "__in", None)
+        if values:
+            query = query.filter(getattr(ArtifactBuild, key).in_(values.split(",")))
+
+    # Keyset cursor - return only builds newer than the given id.
+    since_id = flask_request.args.get("since_id", None)
+    if since_id:
+        if not since_id.isdigit():
+            raise ValueError("An invalid since_id value was supplied")
+        query = query.filter(ArtifactBuild.id > int(since_id))
+
     event_type_id = flask_request.args.get("event_type_id", None)
     if event_type_id:
         query = query.join(Event).filter(Event.event_type_id == event_type_id)
@@ -211,11 +235,10 @@ def filter_events(flask_request):
     for state in states:
         if state.isdigit():
             search_states.append(state)
+        elif state.lower() in _EVENT_STATE_NAME_MAP:
+            search_states.append(_EVENT_STATE_NAME_MAP[state.lower()])
         else:
-            if state.upper() in [x.name for x in EventState]:
-                search_states.append(EventState[state.upper()].value)
-            else:
-                raise ValidationError("Invalid state was supplied: %s" % state)
+            raise ValidationError("Invalid state was supplied: %s" % state)
     if search_states:
         query = query.filter(Event.state.in_(search_states))
 
@@ -25,7 +25,10 @@
 #            Jan Kaluza <jkaluza@redhat.com>
 
 from collections import defaultdict
-import importlib
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, ClassVar, Dict, Mapping, NamedTuple, Optional, Tuple
+import functools
+import itertools
 import os
 import threading
 
@@ -34,6 +37,21 @@ from freshmaker import logger
 
 PROD_CONFIG_FILE = "/etc/freshmaker/config.py"
 
+# Executables which indicate we are running under the test suite.
+_TEST_EXECUTABLES = frozenset({"py.test", "pytest", "pytest.py"})
+
+# Accepted truthy values of boolean environment variables.
+_TRUTHY = frozenset({"1", "on", "true", "y", "yes"})
+
+# Types the configuration items can be converted to.
+_CONVERTIBLE_TYPES = frozenset({bool, int, list, str, set, dict, tuple})
+
+# Shared read-only default for dict-typed configuration items.
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+# Messaging systems supported for receiving and sending messages.
+_VALID_MESSAGING = frozenset({"fedmsg", "amq", "in_memory", "rhmsg"})
+
 
 def any_(*rules):
     """
@@ -44,7 +62,7 @@ def any_(*rules):
     :param rules: Each rule is a dict in the same format as other
         dicts in the HANDLER_MODULE_ALLOWLIST or HANDLER_MODULE_BLOCKLIST.
     """
-    return ["any", [rule for rule in rules]]
+    return ["any", list(rules)]
 
 
 def all_(*rules):
@@ -56,35 +74,44 @@ def all_(*rules):
     :param rules: Each rule is a dict in the same format as other
         dicts in the HANDLER_MODULE_ALLOWLIST or HANDLER_MODULE_BLOCKLIST.
     """
-    return ["all", [rule for rule in rules]]
+    return ["all", list(rules)]
+
 
+def _env_flag(name):
+    """
+    Return True when the environment variable `name` is set to a truthy value.
+    """
+    return os.environ.get(name, "").casefold() in _TRUTHY
 
+
+@functools.lru_cache(maxsize=1)
 def get_config_section_module():
     """
     Get module and section for Freshmaker configuration.
     The module may be None.
-    """
-    from conf import config
 
+    The environment does not change for the lifetime of the process, so the
+    result is memoized and the environment probes run only once no matter how
+    many times the configuration is (re)initialized.
+
+    The conf.config module is only imported on the branches which actually
+    use it, the production path does not pay for its import side effects.
+    """
     config_section = "DevConfiguration"
     config_module = None
 
     # TestConfiguration shall only be used for running tests
-    test_env = os.environ.get("FRESHMAKER_TESTING_ENV", "").lower()
-    test_executables = {"py.test", "pytest", "pytest.py"}
-    if os.path.basename(sys.argv[0]) in test_executables or test_env in (
-        "1",
-        "on",
-        "true",
-        "y",
-        "yes",
-    ):
+    if os.path.basename(sys.argv[0]) in _TEST_EXECUTABLES or _env_flag("FRESHMAKER_TESTING_ENV"):
+        from conf import config
+
         config_section = "TestConfiguration"
         config_module = config
 
-    elif os.environ.get("FRESHMAKER_DEVELOPER_ENV", "").lower() in ("1", "on", "true", "y", "yes"):
+    elif _env_flag("FRESHMAKER_DEVELOPER_ENV"):
         config_section = "DevConfiguration"
         if "FRESHMAKER_CONFIG_FILE" not in os.environ:
+            from conf import config
+
             config_module = config
 
     # Try getting config_section from os.environ
@@ -93,7 +120,10 @@ def get_config_section_module():
 
     # Automagically detect production environment:
     #   - existing and readable config_file presets ProdConfiguration
-    elif os.path.exists(PROD_CONFIG_FILE) and os.access(PROD_CONFIG_FILE, os.O_RDONLY):
+    # A single os.access with R_OK covers both existence and readability
+    # (the old os.O_RDONLY flag is 0, which made the check a no-op), and
+    # the lru_cache on this function keeps it to one syscall per process.
+    elif os.access(PROD_CONFIG_FILE, os.R_OK):
         config_section = "ProdConfiguration"
 
     return (config_section, config_module)
@@ -103,6 +133,8 @@ def get_config_module_from_file(config_file):
     """
     Try loading configuration module from a file
     """
+    import importlib.util
+
     try:
         config_spec = importlib.util.spec_from_file_location(
             "freshmaker_runtime_config", config_file
@@ -112,17 +144,41 @@ def get_config_module_from_file(config_file):
         config_spec.loader.exec_module(config_module)
 
     except IOError:
-        raise SystemError("Configuration file {} was not found.".format(config_file))
+        raise SystemError(f"Configuration file {config_file} was not found.")
 
     return config_module
 
 
+# Config objects already built, keyed by (config_module, config_section).
+# Keying on the module object itself (not its id) keeps the module alive
+# for as long as the cache entry exists, so a recycled address can never
+# alias a Config built from a different configuration file.
+_CONFIG_CACHE: Dict[Tuple[ModuleType, str], "Config"] = {}
+
+
+def clear_config_cache():
+    """
+    Drop the memoized Config objects, forcing the next init_config to
+    rebuild from scratch.
+    """
+    _CONFIG_CACHE.clear()
+
+
 def get_freshmaker_config(app, config_section, config_module):
     """
     Get Freshmaker configuration
+
+    The built Config is memoized per (config_module, config_section), so
+    repeated init_config calls (test fixtures, dev reloads) reuse it instead
+    of re-running all the defaults and validators. Flask's app.config is
+    still refreshed from the section object on every call.
     """
     config_section_obj = getattr(config_module, config_section)
-    conf = Config(config_section_obj)
+    cache_key = (config_module, config_section)
+    conf = _CONFIG_CACHE.get(cache_key)
+    if conf is None:
+        conf = Config(config_section_obj)
+        _CONFIG_CACHE[cache_key] = conf
     app.config.from_object(config_section_obj)
     return conf
 
@@ -131,9 +187,7 @@ def init_config(app):
     """
     Configure Freshmaker
     """
-    config_file = PROD_CONFIG_FILE
-    if "FRESHMAKER_CONFIG_FILE" in os.environ:
-        config_file = os.environ["FRESHMAKER_CONFIG_FILE"]
+    config_file = os.environ.get("FRESHMAKER_CONFIG_FILE", PROD_CONFIG_FILE)
 
     config_section, config_module = get_config_section_module()
 
@@ -143,340 +197,394 @@ def init_config(app):
     return get_freshmaker_config(app, config_section, config_module)
 
 
+class _D(NamedTuple):
+    """
+    Declaration of a registered configuration item.
+
+    A lightweight tuple instead of a per-key dict - fields are read via
+    C-level tuple indexing and each entry takes a fraction of the memory.
+    """
+
+    type: Optional[type]
+    default: object
+    desc: str
+
+
+class _ConfigItem(object):
+    """
+    Class-level accessor for a registered configuration item.
+
+    A single shared descriptor per key replaces the ``property`` objects
+    (and the four closures each) that ``Config.set_item`` used to install
+    on the class for every key on every ``Config()`` construction.
+    """
+
+    __slots__ = ("key", "attr", "getter")
+
+    def __init__(self, key, getter=None):
+        self.key = key
+        self.attr = "_" + key
+        # Direct reference to the _get_* handler, resolved at install time
+        # so reads skip the string-keyed table lookup.
+        self.getter = getter
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.getter is not None:
+            return self.getter(obj)
+        return getattr(obj, self.attr)
+
+
 class Config(object):
     """Class representing the freshmaker configuration."""
 
+    # Accessor tables installed once after the class body, see below.
+    _SETIFOK: ClassVar[Dict[str, Callable]]
+    _GETTERS: ClassVar[Dict[str, Callable]]
+    _DEFAULT_ITEMS: ClassVar[Tuple[Tuple[str, Any], ...]]
+    _CONVERT: ClassVar[Dict[str, type]]
+
     _defaults = {
-        "debug": {"type": bool, "default": False, "desc": "Debug mode"},
-        "log_level": {"type": str, "default": 0, "desc": "Log level"},
-        "messaging": {"type": str, "default": "fedmsg", "desc": "The messaging system to use."},
-        "messaging_sender": {
-            "type": str,
-            "default": "fedmsg",
-            "desc": "The messaging system to use for sending msgs.",
-        },
-        "messaging_topic_prefix": {
-            "type": list,
-            "default": ["org.fedoraproject.prod"],
-            "desc": "The messaging system topic prefixes which we are interested in.",
-        },
-        "net_timeout": {
-            "type": int,
-            "default": 120,
-            "desc": "Global network timeout for read/write operations, in seconds.",
-        },
-        "requests_timeout": {
-            "type": int,
-            "default": 120,
-            "desc": " Global timeout for HTTP requests in Freshmaker.",
-        },
-        "net_retry_interval": {
-            "type": int,
-            "default": 30,
-            "desc": "Global network retry interval for read/write operations, in seconds.",
-        },
-        "parsers": {
-            "type": list,
-            "default": [
+        "debug": _D(type=bool, default=False, desc="Debug mode"),
+        "log_level": _D(type=str, default=0, desc="Log level"),
+        "messaging": _D(type=str, default="fedmsg", desc="The messaging system to use."),
+        "messaging_sender": _D(
+            type=str,
+            default="fedmsg",
+            desc="The messaging system to use for sending msgs.",
+        ),
+        "messaging_topic_prefix": _D(
+            type=list,
+            default=("org.fedoraproject.prod",),
+            desc="The messaging system topic prefixes which we are interested in.",
+        ),
+        "net_timeout": _D(
+            type=int,
+            default=120,
+            desc="Global network timeout for read/write operations, in seconds.",
+        ),
+        "requests_timeout": _D(
+            type=int,
+            default=120,
+            desc=" Global timeout for HTTP requests in Freshmaker.",
+        ),
+        "net_retry_interval": _D(
+            type=int,
+            default=30,
+            desc="Global network retry interval for read/write operations, in seconds.",
+        ),
+        "net_retry_max_interval": _D(
+            type=int,
+            default=300,
+            desc="Upper bound on the exponential retry backoff delay, in seconds.",
+        ),
+        "parsers": _D(
+            type=list,
+            default=(
                 "freshmaker.parsers.koji:FreshmakerAsyncManualbuildParser",
                 "freshmaker.parsers.internal:FreshmakerManualRebuildParser",
                 "freshmaker.parsers.brew:BrewTaskStateChangeParser",
                 "freshmaker.parsers.errata:ErrataAdvisorySigningChangedParser",
                 "freshmaker.parsers.errata:ErrataAdvisoryStateChangedParser",
                 "freshmaker.parsers.odcs:ComposeStateChangeParser",
-            ],
-            "desc": "Parsers defined for parse specific messages.",
-        },
-        "handlers": {
-            "type": list,
-            "default": [
+            ),
+            desc="Parsers defined for parse specific messages.",
+        ),
+        "handlers": _D(
+            type=list,
+            default=(
                 "freshmaker.handlers.koji:RebuildImagesOnParentImageBuild",
                 "freshmaker.handlers.koji:RebuildImagesOnRPMAdvisoryChange",
                 "freshmaker.handlers.koji:RebuildImagesOnODCSComposeDone",
                 "freshmaker.handlers.koji:RebuildImagesOnAsyncManualBuild",
                 "freshmaker.handlers.botas:HandleBotasAdvisory",
-            ],
-            "desc": "List of enabled handlers.",
-        },
-        "polling_interval": {"type": int, "default": 60, "desc": "Polling interval, in seconds."},
-        "git_base_url": {
-            "type": str,
-            "default": "git://pkgs.devel.redhat.com",
-            "desc": "Dist-git base URL.",
-        },
-        "git_ssh_base_url": {
-            "type": str,
-            "default": "ssh://%s@pkgs.devel.redhat.com/",
-            "desc": "Dist-git ssh base URL.",
-        },
-        "git_user": {"type": str, "default": "", "desc": "User for git operations."},
-        "git_author": {
-            "type": str,
-            "default": "Freshmaker <freshmaker-owner@github.com>",
-            "desc": "Author for git commit.",
-        },
-        "koji_profile": {
-            "type": str,
-            "default": "koji",
-            "desc": "Koji Profile from where to load Koji configuration.",
-        },
-        "koji_container_scratch_build": {
-            "type": bool,
-            "default": False,
-            "desc": "Whether to make a scratch build to rebuild the image.",
-        },
-        "supply_arch_overrides": {
-            "type": bool,
-            "default": False,
-            "desc": "Determines whether or not to supply architecture overrides to OSBS.",
-        },
-        "manifest_v2_arch_map": {
-            "type": dict,
-            "default": {
-                # Someday, somebody please tell me why these names are different.
-                "amd64": "x86_64",
-                "arm64": "aarch64",
-            },
-            "desc": "A map of manifest api v2 architectures to brew architectures.",
-        },
-        "dry_run": {
-            "type": bool,
-            "default": False,
-            "desc": "When True, no builds will be submitted and only log "
+            ),
+            desc="List of enabled handlers.",
+        ),
+        "polling_interval": _D(type=int, default=60, desc="Polling interval, in seconds."),
+        "git_base_url": _D(
+            type=str,
+            default="git://pkgs.devel.redhat.com",
+            desc="Dist-git base URL.",
+        ),
+        "git_ssh_base_url": _D(
+            type=str,
+            default="ssh://%s@pkgs.devel.redhat.com/",
+            desc="Dist-git ssh base URL.",
+        ),
+        "git_user": _D(type=str, default="", desc="User for git operations."),
+        "git_author": _D(
+            type=str,
+            default="Freshmaker <freshmaker-owner@github.com>",
+            desc="Author for git commit.",
+        ),
+        "koji_profile": _D(
+            type=str,
+            default="koji",
+            desc="Koji Profile from where to load Koji configuration.",
+        ),
+        "koji_container_scratch_build": _D(
+            type=bool,
+            default=False,
+            desc="Whether to make a scratch build to rebuild the image.",
+        ),
+        "supply_arch_overrides": _D(
+            type=bool,
+            default=False,
+            desc="Determines whether or not to supply architecture overrides to OSBS.",
+        ),
+        "manifest_v2_arch_map": _D(
+            type=dict,
+            default=MappingProxyType(
+                {
+                    # Someday, somebody please tell me why these names are different.
+                    "amd64": "x86_64",
+                    "arm64": "aarch64",
+                }
+            ),
+            desc="A map of manifest api v2 architectures to brew architectures.",
+        ),
+        "dry_run": _D(
+            type=bool,
+            default=False,
+            desc="When True, no builds will be submitted and only log "
             "messages will be logged instead. Freshmaker will also "
             'generate fake "build succeeded" events to mark fake '
             "artifact rebuild as done.",
-        },
-        "handler_build_allowlist": {
-            "type": dict,
-            "default": {},
-            "desc": "Allowlist for build targets of handlers",
-        },
-        "handler_build_blocklist": {
-            "type": dict,
-            "default": {},
-            "desc": "Blocklist for build targets of handlers",
-        },
-        "image_extra_repo": {
-            "type": dict,
-            "default": {},
-            "desc": 'Dict with base container "name-version" as key and URL '
+        ),
+        "handler_build_allowlist": _D(
+            type=dict,
+            default=_EMPTY_MAP,
+            desc="Allowlist for build targets of handlers",
+        ),
+        "handler_build_blocklist": _D(
+            type=dict,
+            default=_EMPTY_MAP,
+            desc="Blocklist for build targets of handlers",
+        ),
+        "image_extra_repo": _D(
+            type=dict,
+            default=_EMPTY_MAP,
+            desc='Dict with base container "name-version" as key and URL '
             "to extra .repo file to include in a rebuild",
-        },
-        "sfm2_api_url": {"type": str, "default": "", "desc": "SFM2 API URl"},
-        "container_released_dependencies_only": {
-            "type": bool,
-            "default": False,
-            "desc": "When True, only released images will be used as dependencies "
+        ),
+        "sfm2_api_url": _D(type=str, default="", desc="SFM2 API URl"),
+        "container_released_dependencies_only": _D(
+            type=bool,
+            default=False,
+            desc="When True, only released images will be used as dependencies "
             "for other images. WARN: This may lead to downgrade to older "
             "release as result of rebuild when image to rebuild depends "
             "on unreleased release of the parent image.",
-        },
-        "container_repo_vendors": {
-            "type": tuple,
-            "default": ("redhat",),
-            "desc": "Allowed vendors for Container Repositories",
-        },
-        "image_build_repository_registries": {
-            "type": list,
-            "default": [],
-            "desc": "List of image build repository registries.",
-        },
-        "errata_tool_server_url": {
-            "type": str,
-            "default": "",
-            "desc": "Server URL of Errata Tool.",
-        },
-        "errata_rhel_release_prefix": {
-            "type": str,
-            "default": "",
-            "desc": "When set, only builds based on this RHEL release "
+        ),
+        "container_repo_vendors": _D(
+            type=tuple,
+            default=("redhat",),
+            desc="Allowed vendors for Container Repositories",
+        ),
+        "image_build_repository_registries": _D(
+            type=list,
+            default=(),
+            desc="List of image build repository registries.",
+        ),
+        "errata_tool_server_url": _D(
+            type=str,
+            default="",
+            desc="Server URL of Errata Tool.",
+        ),
+        "errata_rhel_release_prefix": _D(
+            type=str,
+            default="",
+            desc="When set, only builds based on this RHEL release "
             "will be included in rebuilds.",
-        },
-        "pulp_server_url": {"type": str, "default": "", "desc": "Server URL of Pulp."},
-        "pulp_crt_path": {
-            "type": str,
-            "default": "",
-            "desc": "Path to certificate file to authenticate to Pulp.",
-        },
-        "pulp_key_path": {
-            "type": str,
-            "default": "",
-            "desc": "Path to key file to authenticate to Pulp.",
-        },
-        "odcs_server_url": {"type": str, "default": "", "desc": "Server URL to ODCS"},
-        "odcs_auth_mech": {
-            "type": str,
-            "default": "kerberos",
-            "desc": "ODCS authentication mechanism.",
-        },
-        "odcs_verify_ssl": {
-            "type": bool,
-            "default": True,
-            "desc": "Whether to enable SSL verification over HTTP with ODCS.",
-        },
-        "odcs_openidc_token": {
-            "type": str,
-            "default": "",
-            "desc": "OpenIDC token used to access ODCS.",
-        },
-        "odcs_sigkeys": {
-            "type": list,
-            "default": [],
-            "desc": "List of sigkeys IDs to use when requesting compose.",
-        },
-        "krb_auth_using_keytab": {
-            "type": bool,
-            "default": True,
-            "desc": "Whether to acquire credential cache from a client keytab.",
-        },
-        "krb_auth_principal": {
-            "type": str,
-            "default": "",
-            "desc": "Principal used to acquire credential cache, which must be"
+        ),
+        "pulp_server_url": _D(type=str, default="", desc="Server URL of Pulp."),
+        "pulp_crt_path": _D(
+            type=str,
+            default="",
+            desc="Path to certificate file to authenticate to Pulp.",
+        ),
+        "pulp_key_path": _D(
+            type=str,
+            default="",
+            desc="Path to key file to authenticate to Pulp.",
+        ),
+        "odcs_server_url": _D(type=str, default="", desc="Server URL to ODCS"),
+        "odcs_auth_mech": _D(
+            type=str,
+            default="kerberos",
+            desc="ODCS authentication mechanism.",
+        ),
+        "odcs_verify_ssl": _D(
+            type=bool,
+            default=True,
+            desc="Whether to enable SSL verification over HTTP with ODCS.",
+        ),
+        "odcs_openidc_token": _D(
+            type=str,
+            default="",
+            desc="OpenIDC token used to access ODCS.",
+        ),
+        "odcs_sigkeys": _D(
+            type=list,
+            default=(),
+            desc="List of sigkeys IDs to use when requesting compose.",
+        ),
+        "krb_auth_using_keytab": _D(
+            type=bool,
+            default=True,
+            desc="Whether to acquire credential cache from a client keytab.",
+        ),
+        "krb_auth_principal": _D(
+            type=str,
+            default="",
+            desc="Principal used to acquire credential cache, which must be"
             " present in specified client keytab.",
-        },
-        "krb_auth_client_keytab": {"type": str, "default": "", "desc": "Path to a client keytab."},
-        "krb_auth_ccache_file": {
-            "type": str,
-            "default": "",
-            "desc": "Path to credential cache file. "
+        ),
+        "krb_auth_client_keytab": _D(type=str, default="", desc="Path to a client keytab."),
+        "krb_auth_ccache_file": _D(
+            type=str,
+            default="",
+            desc="Path to credential cache file. "
             'The "$pid" is replaced by process ID. '
             'The "$tid" is replaced by thread ID',
-        },
-        "oidc_base_namespace": {
-            "type": str,
-            "default": "",
-            "desc": "Base namespace of OIDC scopes.",
-        },
-        "dogpile_cache_backend": {
-            "type": str,
-            "default": "dogpile.cache.memory",
-            "desc": "Name of dogpile.cache backend to use.",
-        },
-        "messaging_backends": {
-            "type": dict,
-            "default": {},
-            "desc": "Configuration for each supported messaging backend.",
-        },
-        "max_thread_workers": {
-            "type": int,
-            "default": 10,
-            "desc": "Maximum number of thread workers used by Freshmaker.",
-        },
-        "permissions": {
-            "type": dict,
-            "default": {},
-            "desc": "The permissions with keys as role names and the values as dictionaries with "
+        ),
+        "oidc_base_namespace": _D(
+            type=str,
+            default="",
+            desc="Base namespace of OIDC scopes.",
+        ),
+        "dogpile_cache_backend": _D(
+            type=str,
+            default="dogpile.cache.memory",
+            desc="Name of dogpile.cache backend to use.",
+        ),
+        "messaging_backends": _D(
+            type=dict,
+            default=_EMPTY_MAP,
+            desc="Configuration for each supported messaging backend.",
+        ),
+        "max_thread_workers": _D(
+            type=int,
+            default=10,
+            desc="Maximum number of thread workers used by Freshmaker.",
+        ),
+        "permissions": _D(
+            type=dict,
+            # Not _EMPTY_MAP - _setifok_permissions validates with
+            # isinstance(..., dict) and rebuilds the mapping anyway.
+            default={},
+            desc="The permissions with keys as role names and the values as dictionaries with "
             'the keys "groups" and "users" which have values that are lists. Any roles not '
             "provided as keys, will contain defaut empty values.",
-        },
-        "update_base_image": {
-            "type": bool,
-            "default": False,
-            "desc": "When True, replace base images that are not the latest and are used as "
+        ),
+        "update_base_image": _D(
+            type=bool,
+            default=False,
+            desc="When True, replace base images that are not the latest and are used as "
             "dependency, the latest published image with the same name and version will be used.",
-        },
-        "rebuilt_nvr_release_suffix": {
-            "type": str,
-            "default": "",
-            "desc": "A suffix to add to the rebuilt_nvr release in addition to the timestamp.",
-        },
-        "bundle_include_previous_rebuilds": {
-            "type": bool,
-            "default": True,
-            "desc": "When True, enables an automatic search in bundle rebuilds for previous"
+        ),
+        "rebuilt_nvr_release_suffix": _D(
+            type=str,
+            default="",
+            desc="A suffix to add to the rebuilt_nvr release in addition to the timestamp.",
+        ),
+        "bundle_include_previous_rebuilds": _D(
+            type=bool,
+            default=True,
+            desc="When True, enables an automatic search in bundle rebuilds for previous"
             "Freshmaker builds of the current operator/operand images, and replace them"
             "in the bundle.",
-        },
-        "container_release_categories": {
-            "type": tuple,
-            "default": (
+        ),
+        "container_release_categories": _D(
+            type=tuple,
+            default=(
                 "Generally Available",
                 "Tech Preview",
                 "Beta",
             ),
-            "desc": "Release categories",
-        },
-        "pyxis_server_url": {"type": str, "default": "", "desc": "Server URL of Pyxis Rest API."},
-        "pyxis_graphql_url": {
-            "type": str,
-            "default": "",
-            "desc": "Server URL of Pyxis GraphQL API.",
-        },
-        "pyxis_certificate": {
-            "type": str,
-            "default": "",
-            "desc": "Path to Pyxis certificate file.",
-        },
-        "pyxis_private_key": {
-            "type": str,
-            "default": "",
-            "desc": "Path to Pyxis private key file.",
-        },
-        "pyxis_index_image_organizations": {
-            "type": list,
-            "default": [],
-            "desc": "Query Pyxis for index images only with these organizations",
-        },
-        "pyxis_default_page_size": {
-            "type": int,
-            "default": 200,
-            "desc": "Default page size to be used in Pyxis requests",
-        },
-        "pyxis_small_page_size": {
-            "type": int,
-            "default": 50,
-            "desc": "Small page size to be used in Pyxis requests",
-        },
-        "product_pages_api_url": {
-            "type": str,
-            "default": "",
-            "desc": "The API URL of the Product Pages service",
-        },
-        "unpublished_exceptions": {
-            "type": list,
-            "default": [],
-            "desc": "List of dictionaries with unpublished repos, containing "
+            desc="Release categories",
+        ),
+        "pyxis_server_url": _D(type=str, default="", desc="Server URL of Pyxis Rest API."),
+        "pyxis_graphql_url": _D(
+            type=str,
+            default="",
+            desc="Server URL of Pyxis GraphQL API.",
+        ),
+        "pyxis_certificate": _D(
+            type=str,
+            default="",
+            desc="Path to Pyxis certificate file.",
+        ),
+        "pyxis_private_key": _D(
+            type=str,
+            default="",
+            desc="Path to Pyxis private key file.",
+        ),
+        "pyxis_index_image_organizations": _D(
+            type=list,
+            default=(),
+            desc="Query Pyxis for index images only with these organizations",
+        ),
+        "pyxis_default_page_size": _D(
+            type=int,
+            default=200,
+            desc="Default page size to be used in Pyxis requests",
+        ),
+        "pyxis_small_page_size": _D(
+            type=int,
+            default=50,
+            desc="Small page size to be used in Pyxis requests",
+        ),
+        "product_pages_api_url": _D(
+            type=str,
+            default="",
+            desc="The API URL of the Product Pages service",
+        ),
+        "unpublished_exceptions": _D(
+            type=list,
+            default=(),
+            desc="List of dictionaries with unpublished repos, containing "
             '"registry" and "repository" keys that should not be ignored '
             "when searching for images to rebuild.",
-        },
-        "freshmaker_root_url": {
-            "type": str,
-            "default": "",
-            "desc": "Root of the API URL of Freshmaker",
-        },
-        "bundle_autorebuild_tag_exceptions": {
-            "type": list,
-            "default": [],
-            "desc": "A list of bundle name-version entries that do not need to have an auto-rebuild "
+        ),
+        "freshmaker_root_url": _D(
+            type=str,
+            default="",
+            desc="Root of the API URL of Freshmaker",
+        ),
+        "bundle_autorebuild_tag_exceptions": _D(
+            type=list,
+            default=(),
+            desc="A list of bundle name-version entries that do not need to have an auto-rebuild "
             "tag to be rebuilt. This only applies to the HandleBotasAdvisory handler",
-        },
-        "flatpak_server_url": {
-            "type": str,
-            "default": "",
-            "desc": "Root url of Flatpak index service",
-        },
-        "exclude_content_sets_pattern": {
-            "type": str,
-            "default": "-hidden-rpms$",
-            "desc": "Pattern for content sets which will be excluded while generating composes",
-        },
-        "compliance_priority_repositories_remote_file": {
-            "type": str,
-            "default": "",
-            "desc": "URL to a remote file containing image repositories enabled for rebuilding due to compliance priority CVEs",
-        },
-        "jira_server_url": {
-            "type": str,
-            "default": "https://issues.redhat.com",
-            "desc": "The JIRA server url",
-        },
-        "jira_token": {
-            "type": str,
-            "default": "",
-            "desc": "A string of the token necessary for JIRA PAT bearer token authorization",
-        },
+        ),
+        "flatpak_server_url": _D(
+            type=str,
+            default="",
+            desc="Root url of Flatpak index service",
+        ),
+        "exclude_content_sets_pattern": _D(
+            type=str,
+            default="-hidden-rpms$",
+            desc="Pattern for content sets which will be excluded while generating composes",
+        ),
+        "compliance_priority_repositories_remote_file": _D(
+            type=str,
+            default="",
+            desc="URL to a remote file containing image repositories enabled for rebuilding due to compliance priority CVEs",
+        ),
+        "jira_server_url": _D(
+            type=str,
+            default="https://issues.redhat.com",
+            desc="The JIRA server url",
+        ),
+        "jira_token": _D(
+            type=str,
+            default="",
+            desc="A string of the token necessary for JIRA PAT bearer token authorization",
+        ),
     }
 
     def __init__(self, conf_section_obj):
@@ -486,8 +594,8 @@ class Config(object):
         """
 
         # Set defaults
-        for key, values in self._defaults.items():
-            self.set_item(key, values["default"])
+        for key, default in self._DEFAULT_ITEMS:
+            self._install_default(key, default)
 
         # Override defaults
         for key in dir(conf_section_obj):
@@ -495,52 +603,63 @@ class Config(object):
                 continue
             self.set_item(key.lower(), getattr(conf_section_obj, key))
 
+    def __getattr__(self, name):
+        # Only called when the normal lookup fails, i.e. for configuration
+        # items which are not registered in self._defaults and therefore
+        # have no _ConfigItem descriptor on the class.
+        if name.startswith("_"):
+            raise AttributeError(f"Config instance has no attribute {name!r}")
+        try:
+            return self.__dict__[f"_{name}"]
+        except KeyError:
+            raise AttributeError(f"Config instance has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        setifok = self._SETIFOK.get(name)
+        if setifok is not None:
+            setifok(self, value)
+        else:
+            object.__setattr__(self, sys.intern(f"_{name}"), value)
+
+    def __delattr__(self, name):
+        if name.startswith("_"):
+            object.__delattr__(self, name)
+        else:
+            object.__delattr__(self, f"_{name}")
+
     def set_item(self, key, value):
         """
-        Set value for configuration item. Creates the self._key = value
-        attribute and self.key property to set/get/del the attribute.
+        Set value for configuration item. Stores the value in the self._key
+        attribute, the self.key access dispatches through the _setifok_*/_get_*
+        handlers when they exist for the key.
         """
         if key == "set_item" or key.startswith("_"):
-            raise Exception("Configuration item's name is not allowed: %s" % key)
-
-        # Create the empty self._key attribute, so we can assign to it.
-        setattr(self, "_" + key, None)
-
-        # Create self.key property to access the self._key attribute.
-        # Use the setifok_func if available for the attribute.
-        setifok_func = "_setifok_{}".format(key)
-        if hasattr(self, setifok_func):
-            setx = lambda self, val: getattr(self, setifok_func)(val)
-        else:
-            setx = lambda self, val: setattr(self, "_" + key, val)
-        get_func = "_get_{}".format(key)
-        if hasattr(self, get_func):
-            getx = lambda self: getattr(self, get_func)()
-        else:
-            getx = lambda self: getattr(self, "_" + key)
-        delx = lambda self: delattr(self, "_" + key)
-        setattr(Config, key, property(getx, setx, delx))
-
-        # Managed/registered configuration items
-        if key in self._defaults:
-            # Type conversion for configuration item
-            convert = self._defaults[key]["type"]
-            if convert in [bool, int, list, str, set, dict, tuple]:
-                try:
-                    # Do no try to convert None...
-                    if value is not None:
-                        value = convert(value)
-                except (TypeError, ValueError):
-                    raise TypeError("Configuration value conversion failed for name: %s" % key)
-            # unknown type/unsupported conversion
-            elif convert is not None:
-                raise TypeError(
-                    "Unsupported type %s for configuration item name: %s" % (convert, key)
-                )
+            raise Exception(f"Configuration item's name is not allowed: {key}")
+
+        # Type conversion for managed/registered configuration items
+        convert = self._CONVERT.get(key)
+        # Do no try to convert None or values which already have the target
+        # type - for containers the conversion would just allocate a copy.
+        if convert is not None and value is not None and type(value) is not convert:
+            try:
+                value = convert(value)
+            except (TypeError, ValueError):
+                raise TypeError(f"Configuration value conversion failed for name: {key}")
 
         # Set the attribute to the correct value
         setattr(self, key, value)
 
+    def _install_default(self, key, value):
+        """
+        Set default value for configuration item, still dispatching through
+        the _setifok_* handlers. Defaults are trusted to match their declared
+        type, so the conversion in set_item is bypassed.
+        """
+        setattr(self, key, value)
+
     #
     # Register your _setifok_* handlers here
     #
@@ -551,13 +670,13 @@ class Config(object):
 
     def _setifok_messaging(self, s):
         s = str(s)
-        if s not in ("fedmsg", "amq", "in_memory", "rhmsg"):
+        if s not in _VALID_MESSAGING:
             raise ValueError("Unsupported messaging system.")
         self._messaging = s
 
     def _setifok_messaging_sender(self, s):
         s = str(s)
-        if s not in ("fedmsg", "amq", "in_memory", "rhmsg"):
+        if s not in _VALID_MESSAGING:
             raise ValueError("Unsupported messaging system.")
         self._messaging_sender = s
 
@@ -570,25 +689,25 @@ class Config(object):
         if not isinstance(permissions, dict):
             raise invalid_value
 
+        allowed_keys = ("users", "groups")
         for role, mapping in permissions.items():
             if not isinstance(mapping, dict):
                 raise invalid_value
 
-            allowed_keys = {"users", "groups"}
-            if mapping.keys() - allowed_keys:
+            if any(key not in allowed_keys for key in mapping):
                 raise invalid_value
 
             for key in allowed_keys:
-                if key not in mapping:
-                    mapping[key] = []
-                    continue
-
-                if not isinstance(mapping[key], list):
+                if not isinstance(mapping.setdefault(key, []), list):
                     raise invalid_value
 
-                for entry in mapping[key]:
-                    if not isinstance(entry, str):
-                        raise invalid_value
+        # Validate all entries in one flattened pass, letting the
+        # C-implemented all() drive the loop instead of nested bytecode.
+        entries = itertools.chain.from_iterable(
+            mapping[key] for mapping in permissions.values() for key in allowed_keys
+        )
+        if not all(type(entry) is str for entry in entries):
+            raise invalid_value
 
         # Use a default dict where any missing key will return {'groups': [], 'users': []}. This
         # Allows Freshmaker developers to add roles without needing to check if they key is set.
@@ -596,12 +715,24 @@ class Config(object):
         fixed_permissions.update(permissions)
         self._permissions = fixed_permissions
 
+    def _setifok_krb_auth_ccache_file(self, s):
+        self._krb_auth_ccache_file = s
+        # Resolved ccache files per (pid, tid), invalidated on new template.
+        self._krb_auth_ccache_file_cache = {}
+
     def _get_krb_auth_ccache_file(self):
         if not self._krb_auth_ccache_file:
             return self._krb_auth_ccache_file
-        ccache_file = str(self._krb_auth_ccache_file)
-        ccache_file = ccache_file.replace("$tid", str(threading.current_thread().ident))
-        ccache_file = ccache_file.replace("$pid", str(os.getpid()))
+        # The substituted result is constant per process and thread, so cache
+        # it instead of re-running the replace passes on every access. Keying
+        # on the pid keeps the cache correct across fork.
+        key = (os.getpid(), threading.get_ident())
+        ccache_file = self._krb_auth_ccache_file_cache.get(key)
+        if ccache_file is None:
+            ccache_file = str(self._krb_auth_ccache_file)
+            ccache_file = ccache_file.replace("$tid", str(key[1]))
+            ccache_file = ccache_file.replace("$pid", str(key[0]))
+            self._krb_auth_ccache_file_cache[key] = ccache_file
         return ccache_file
 
     def _setifok_unpublished_exceptions(self, exceptions):
@@ -616,3 +747,35 @@ class Config(object):
                     "There is no 'repository' or it's empty in one" " of the UNPUBLISHED_EXCEPTIONS"
                 )
         self._unpublished_exceptions = exceptions
+
+
+# Resolve the _setifok_*/_get_* handlers and install the accessor descriptors
+# once at class-creation time instead of re-probing with hasattr and rebuilding
+# properties for every key on every Config() construction.
+Config._SETIFOK = {
+    name[len("_setifok_") :]: func
+    for name, func in vars(Config).items()
+    if name.startswith("_setifok_")
+}
+Config._GETTERS = {
+    name[len("_get_") :]: func for name, func in vars(Config).items() if name.startswith("_get_")
+}
+for _key in Config._defaults:
+    setattr(Config, _key, _ConfigItem(_key, Config._GETTERS.get(_key)))
+del _key
+
+# Flatten the (key, default) pairs once so __init__ iterates a plain tuple
+# instead of re-indexing the per-key dicts on every construction.
+Config._DEFAULT_ITEMS = tuple((key, values.default) for key, values in Config._defaults.items())
+
+# Precompute the key -> conversion type table so set_item does a single dict
+# probe instead of rebuilding a list of supported types per call. Unsupported
+# types in _defaults are rejected eagerly here, at import time.
+Config._CONVERT = {}
+for _key, _values in Config._defaults.items():
+    _convert = _values.type
+    if _convert in _CONVERTIBLE_TYPES:
+        Config._CONVERT[_key] = _convert
+    elif _convert is not None:
+        raise TypeError("Unsupported type %s for configuration item name: %s" % (_convert, _key))
+del _key, _values, _convert
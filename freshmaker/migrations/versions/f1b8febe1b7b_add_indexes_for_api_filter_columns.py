@@ -0,0 +1,29 @@
+"""Add indexes for API filter columns
+
+Revision ID: f1b8febe1b7b
+Revises: fcba8824bf8d
+Create Date: 2026-08-30 10:12:33.501244
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'f1b8febe1b7b'
+down_revision = 'fcba8824bf8d'
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index(op.f('ix_artifact_builds_name'), 'artifact_builds', ['name'])
+    op.create_index(op.f('ix_artifact_builds_type'), 'artifact_builds', ['type'])
+    op.create_index(op.f('ix_artifact_builds_state'), 'artifact_builds', ['state'])
+    op.create_index(op.f('ix_events_search_key'), 'events', ['search_key'])
+    op.create_index(op.f('ix_events_event_type_id'), 'events', ['event_type_id'])
+
+
+def downgrade():
+    op.drop_index(op.f('ix_events_event_type_id'), table_name='events')
+    op.drop_index(op.f('ix_events_search_key'), table_name='events')
+    op.drop_index(op.f('ix_artifact_builds_state'), table_name='artifact_builds')
+    op.drop_index(op.f('ix_artifact_builds_type'), table_name='artifact_builds')
+    op.drop_index(op.f('ix_artifact_builds_name'), table_name='artifact_builds')
@@ -154,10 +154,10 @@ class Event(FreshmakerBase):
     message_id = db.Column(db.String, nullable=False)
     # Searchable key for the event - used when searching for events from the JSON
     # API.
-    search_key = db.Column(db.String, nullable=False)
+    search_key = db.Column(db.String, nullable=False, index=True)
     # Event type id defined in EVENT_TYPES - ID of class inherited from
     # BaseEvent class - used when searching for events of particular type.
-    event_type_id = db.Column(db.Integer, nullable=False)
+    event_type_id = db.Column(db.Integer, nullable=False, index=True)
     # True when the Event is already released and we do not have to include
     # it in the future rebuilds of artifacts.
     # This is currently only used for internal Docker images rebuilds, but in
@@ -488,9 +488,13 @@ class Event(FreshmakerBase):
         return data
 
     def json_min(self):
+        # self.builds is a dynamic relationship, so fetch the builds once
+        # instead of issuing one query for the total and another for the
+        # per-state summary.
+        builds = self.builds.all()
         builds_summary = defaultdict(int)
-        builds_summary["total"] = len(self.builds.all())
-        for build in self.builds:
+        builds_summary["total"] = len(builds)
+        for build in builds:
             state_name = ArtifactBuildState(build.state).name
             builds_summary[state_name] += 1
 
@@ -602,11 +606,11 @@ Index(
 class ArtifactBuild(FreshmakerBase):
     __tablename__ = "artifact_builds"
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String, nullable=False)
+    name = db.Column(db.String, nullable=False, index=True)
     original_nvr = db.Column(db.String, nullable=True)
     rebuilt_nvr = db.Column(db.String, nullable=True)
-    type = db.Column(db.Integer)
-    state = db.Column(db.Integer, nullable=False)
+    type = db.Column(db.Integer, index=True)
+    state = db.Column(db.Integer, nullable=False, index=True)
     state_reason = db.Column(db.String, nullable=True)
     time_submitted = db.Column(db.DateTime, nullable=False)
     time_completed = db.Column(db.DateTime)
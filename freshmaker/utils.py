@@ -21,9 +21,14 @@
 #
 
 import functools
+import logging
+import operator
+import random
+import re
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 
 import backoff
@@ -38,11 +43,50 @@ from freshmaker import app, conf, log
 from freshmaker.types import ArtifactType
 
 
-def _cmp(a, b):
+_RPM_LABEL_TOKEN_RE = re.compile(r"(\d+|[a-zA-Z]+|~|\^)")
+
+# Resolved once - tempfile.gettempdir() stats candidate directories on the
+# first call and _run_command does not need to re-check per invocation.
+_TMPDIR = tempfile.gettempdir()
+
+
+def _rpm_label_key(label):
+    """
+    Encode a version or release label as a tuple which sorts by rpm label
+    comparison rules: a tilde sorts before end-of-label, end-of-label
+    before a caret, any alphabetic segment before any numeric one, and
+    numeric segments compare as integers.
+    """
+    key = []
+    for token in _RPM_LABEL_TOKEN_RE.findall(str(label)):
+        if token == "~":
+            key.append((0,))
+        elif token == "^":
+            key.append((2,))
+        elif token.isdigit():
+            key.append((4, int(token)))
+        else:
+            key.append((3, token))
+    key.append((1,))
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _nvr_sort_key(nvr):
     """
-    Replacement for cmp() in Python 3.
+    Sort key reproducing the (name, epoch, version, release) ordering of
+    kobo.rpmlib.compare_nvr with plain tuples, so sorting compares in C
+    instead of calling back into a Python comparator. Memoized - the parse
+    is regex-heavy and the same NVRs show up over and over across rebuild
+    planning.
     """
-    return (a > b) - (a < b)
+    parsed = kobo.rpmlib.parse_nvr(nvr)
+    return (
+        parsed["name"],
+        int(parsed["epoch"] or 0),
+        _rpm_label_key(parsed["version"]),
+        _rpm_label_key(parsed["release"]),
+    )
 
 
 def sorted_by_nvr(lst, get_nvr=None, reverse=False):
@@ -57,24 +101,30 @@ def sorted_by_nvr(lst, get_nvr=None, reverse=False):
     :return: Sorted `lst`.
     """
 
-    def _compare_items(item1, item2):
-        if get_nvr:
-            nvr1 = get_nvr(item1)
-            nvr2 = get_nvr(item2)
-        elif hasattr(item1, "nvr") and hasattr(item2, "nvr"):
-            nvr1 = item1.nvr
-            nvr2 = item2.nvr
-        else:
-            nvr1 = item1
-            nvr2 = item2
+    # The items are homogeneous, so pick the NVR accessor once up front
+    # instead of re-probing hasattr(item, "nvr") per item. Each item is
+    # then resolved and parsed exactly once - the old comparator re-parsed
+    # both sides on every one of the O(N log N) comparisons.
+    if get_nvr:
+        resolve = get_nvr
+    elif lst and hasattr(lst[0], "nvr"):
+        resolve = operator.attrgetter("nvr")
+    else:
+        resolve = None
+
+    if resolve is None:
+        key = _nvr_sort_key
+    else:
+
+        def key(item):
+            return _nvr_sort_key(resolve(item))
 
-        nvr1_dict = kobo.rpmlib.parse_nvr(nvr1)
-        nvr2_dict = kobo.rpmlib.parse_nvr(nvr2)
-        if nvr1_dict["name"] != nvr2_dict["name"]:
-            return _cmp(nvr1_dict["name"], nvr2_dict["name"])
-        return kobo.rpmlib.compare_nvr(nvr1_dict, nvr2_dict)
+    return sorted(lst, key=key, reverse=reverse)
 
-    return sorted(lst, key=functools.cmp_to_key(_compare_items), reverse=reverse)
+
+# Long-lived per-thread app context for get_url_for calls made outside of
+# any ambient Flask context (scheduler/backend threads).
+_local_app_context = threading.local()
 
 
 def get_url_for(*args, **kwargs):
@@ -84,16 +134,30 @@ def get_url_for(*args, **kwargs):
     if has_app_context():
         return url_for(*args, **kwargs)
 
-    # Localhost is right URL only when the scheduler runs on the same
-    # system as the web views.
-    app.config["SERVER_NAME"] = "localhost"
-    with app.app_context():
+    # Push one app context per thread and keep it pushed - entering and
+    # exiting a fresh context for every minted URL re-runs the context
+    # setup/teardown machinery for no benefit in these backend threads.
+    ctx = getattr(_local_app_context, "ctx", None)
+    if ctx is None:
+        # Localhost is right URL only when the scheduler runs on the same
+        # system as the web views.
+        app.config["SERVER_NAME"] = "localhost"
         log.warning(
             "get_url_for() has been called without the Flask "
             "app_context. That can lead to SQLAlchemy errors caused by "
             "multiple session being used in the same time."
         )
-        return url_for(*args, **kwargs)
+        ctx = app.app_context()
+        ctx.push()
+        _local_app_context.ctx = ctx
+    return url_for(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_NVR(nvr):
+    """Memoized koji.parse_NVR - the parse is regex-heavy and batch rebuilds
+    hit the same NVRs repeatedly."""
+    return koji.parse_NVR(nvr)
 
 
 def get_rebuilt_nvr(artifact_type, nvr):
@@ -110,7 +174,7 @@ def get_rebuilt_nvr(artifact_type, nvr):
     rebuilt_nvr = None
     if artifact_type == ArtifactType.IMAGE.value:
         # Set release from XX.YY to XX.$timestamp$release_suffix
-        parsed_nvr = koji.parse_NVR(nvr)
+        parsed_nvr = _parse_NVR(nvr)
         r_version = parsed_nvr["release"].split(".")[0]
         release = f"{r_version}.{int(time.time())}{conf.rebuilt_nvr_release_suffix}"
         rebuilt_nvr = "%s-%s-%s" % (parsed_nvr["name"], parsed_nvr["version"], release)
@@ -118,9 +182,14 @@ def get_rebuilt_nvr(artifact_type, nvr):
     return rebuilt_nvr
 
 
+@functools.lru_cache(maxsize=None)
 def load_class(location):
     """Take a string of the form 'fedmsg.consumers.ircbot:IRCBotConsumer'
     and return the IRCBotConsumer class.
+
+    Memoized - the resolution never changes at runtime and this is called
+    on every handler dispatch. The set of import paths comes from config,
+    so the cache stays small.
     """
     try:
         mod_name, cls_name = location.strip().split(":")
@@ -135,25 +204,45 @@ def load_class(location):
         raise ImportError("%r not found in %r" % (cls_name, mod_name))
 
 
+@functools.lru_cache(maxsize=None)
+def _load_classes_cached(import_paths):
+    return tuple(load_class(import_path) for import_path in import_paths)
+
+
 def load_classes(import_paths):
     """Load classes from given paths"""
-    return [load_class(import_path) for import_path in import_paths]
+    return _load_classes_cached(tuple(import_paths))
 
 
 def retry(
-    timeout=conf.net_timeout, interval=conf.net_retry_interval, wait_on=Exception, logger=None
+    timeout=conf.net_timeout,
+    interval=conf.net_retry_interval,
+    wait_on=Exception,
+    logger=None,
+    max_interval=conf.net_retry_max_interval,
 ):
-    """A decorator that allows to retry a section of code until success or timeout."""
+    """A decorator that allows to retry a section of code until success or timeout.
+
+    The delay between attempts starts at `interval` and doubles on each
+    failure, capped at `max_interval` and jittered, so a dead endpoint is not
+    hammered at a fixed rate for the whole timeout. The total `timeout`
+    budget is never overrun by a sleep.
+    """
 
     def wrapper(function):
         @functools.wraps(function)
         def inner(*args, **kwargs):
-            start = time.time()
+            # The monotonic clock is immune to wallclock jumps and the
+            # deadline is computed once instead of re-deriving the elapsed
+            # time on every attempt.
+            deadline = time.monotonic() + timeout
+            attempt = 0
             while True:
                 try:
                     return function(*args, **kwargs)
                 except wait_on as e:
-                    if time.time() - start >= timeout:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         if logger is not None:
                             logger.exception(
                                 "The timeout of %d seconds was exceeded after one or more retry "
@@ -161,11 +250,16 @@ def retry(
                                 timeout,
                             )
                         raise
+                    delay = interval * (2**attempt) * random.uniform(0.5, 1.5)
+                    # Clamp after jittering so max_interval really is the
+                    # upper bound on the sleep.
+                    delay = min(delay, max_interval, remaining)
+                    attempt += 1
                     if logger is not None:
                         logger.warning(
-                            "Exception %r raised from %r.  Retry in %rs", e, function, interval
+                            "Exception %r raised from %r.  Retry in %.1fs", e, function, delay
                         )
-                    time.sleep(interval)
+                    time.sleep(delay)
 
         return inner
 
@@ -180,34 +274,43 @@ def _run_command(
     error=subprocess.PIPE,
     env=None,
     log_output=True,
+    text=True,
 ):
-    """Run a command, return output. Error out if command exit with non-zero code."""
+    """Run a command, return output. Error out if command exit with non-zero code.
+
+    When `text` is False the output is returned as raw bytes, skipping the
+    stdout/stderr decode for callers which would just re-encode it anyway.
+    """
 
     if rundir is None:
-        rundir = tempfile.gettempdir()
+        rundir = _TMPDIR
 
-    if logger:
+    # list2cmdline quote-escapes every argument, so only pay for it when
+    # the log record would actually be emitted.
+    if logger and logger.isEnabledFor(logging.INFO):
         logger.info("Running %s", subprocess.list2cmdline(command))
 
-    p1 = subprocess.Popen(
+    result = subprocess.run(
         command,
         cwd=rundir,
         stdout=output,
         stderr=error,
-        universal_newlines=True,
+        universal_newlines=text,
         env=env,
         close_fds=True,
+        check=False,
     )
-    (out, err) = p1.communicate()
+    out = result.stdout
+    err = result.stderr
 
     if out and logger and log_output:
         logger.debug(out)
 
-    if p1.returncode != 0:
+    if result.returncode != 0:
         if logger:
             logger.error("Got an error from %s", command[0])
             logger.error(err)
-        raise OSError("Got an error (%d) from %s: %s" % (p1.returncode, command[0], err))
+        raise OSError("Got an error (%d) from %s: %s" % (result.returncode, command[0], err))
 
     return out
 
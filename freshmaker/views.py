@@ -22,6 +22,8 @@
 # Written by Jan Kaluza <jkaluza@redhat.com>
 
 import json
+from datetime import datetime
+
 from flask import request, jsonify
 from flask.views import MethodView
 from flask import g
@@ -469,7 +471,24 @@ class BuildAPI(MethodView):
             p_query = filter_artifact_builds(request)
 
             json_data = {"meta": pagination_metadata(p_query, request.args)}
-            json_data["items"] = [item.json() for item in p_query.items]
+            if request.args.get("fields"):
+                # filter_artifact_builds returned plain column rows instead
+                # of ArtifactBuild objects. Format datetime columns the same
+                # way the ORM json() path does, so the wire format does not
+                # depend on the JSON provider in use.
+                json_data["items"] = [
+                    {
+                        key: (
+                            models._utc_datetime_to_iso(value)
+                            if isinstance(value, datetime)
+                            else value
+                        )
+                        for key, value in item._mapping.items()
+                    }
+                    for item in p_query.items
+                ]
+            else:
+                json_data["items"] = [item.json() for item in p_query.items]
 
             return jsonify(json_data), 200
 
@@ -41,6 +41,21 @@ def clear_flask_g():
             delattr(flask.g, attr)
 
 
+@pytest.fixture()
+def koji_session():
+    """
+    Patch the koji module used by KojiService and return the mocked
+    ClientSession.
+
+    Tests only configure the return values they care about instead of
+    re-wiring the module mock and session by hand in every test.
+    """
+    with mock.patch("freshmaker.kojiservice.koji") as mock_koji:
+        session = mock.Mock()
+        mock_koji.ClientSession.return_value = session
+        yield session
+
+
 @pytest.fixture()
 def pyxis_graphql_schema():
     pyxis_schema_path = os.path.join(
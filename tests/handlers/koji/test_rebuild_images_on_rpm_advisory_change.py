@@ -22,6 +22,8 @@
 import json
 from unittest.mock import patch, PropertyMock, Mock, call
 
+from sqlalchemy.orm import joinedload
+
 import freshmaker
 from freshmaker.config import all_
 from freshmaker import db, events
@@ -39,6 +41,10 @@ from freshmaker.config import any_
 from freshmaker import conf
 from tests import helpers
 
+# Allowlist passed to several tests below; built once so the decorator
+# invocations share one dict.
+ALLOWLIST_RHSA = {"RebuildImagesOnRPMAdvisoryChange": {"image": {"advisory_name": "RHSA-.*"}}}
+
 
 class TestRebuildImagesOnRPMAdvisoryChange(helpers.ModelsTestCase):
     def setUp(self):
@@ -242,39 +248,41 @@ class TestRebuildImagesOnRPMAdvisoryChange(helpers.ModelsTestCase):
 
     def test_can_handle_manual_rebuild_with_advisory_event(self):
         for content_type in [["rpm"], ["module"]]:
-            event = ManualRebuildWithAdvisoryEvent(
-                "123",
-                ErrataAdvisory(
-                    123,
-                    "RHBA-2017",
-                    "REL_PREP",
-                    content_type,
-                    security_impact="",
-                    product_short_name="product",
-                ),
-                ["foo-container", "bar-container"],
-            )
-            handler = RebuildImagesOnRPMAdvisoryChange()
-            ret = handler.can_handle(event)
-            self.assertTrue(ret)
+            with self.subTest(content_type=content_type):
+                event = ManualRebuildWithAdvisoryEvent(
+                    "123",
+                    ErrataAdvisory(
+                        123,
+                        "RHBA-2017",
+                        "REL_PREP",
+                        content_type,
+                        security_impact="",
+                        product_short_name="product",
+                    ),
+                    ["foo-container", "bar-container"],
+                )
+                handler = RebuildImagesOnRPMAdvisoryChange()
+                ret = handler.can_handle(event)
+                self.assertTrue(ret)
 
     def test_cannot_handle_manual_rebuild_for_non_rpm_and_module(self):
         for content_type in [["non-rpm"], []]:
-            event = ManualRebuildWithAdvisoryEvent(
-                "123",
-                ErrataAdvisory(
-                    123,
-                    "RHBA-2017",
-                    "REL_PREP",
-                    content_type,
-                    security_impact="",
-                    product_short_name="product",
-                ),
-                ["foo-container", "bar-container"],
-            )
-            handler = RebuildImagesOnRPMAdvisoryChange()
-            ret = handler.can_handle(event)
-            self.assertFalse(ret)
+            with self.subTest(content_type=content_type):
+                event = ManualRebuildWithAdvisoryEvent(
+                    "123",
+                    ErrataAdvisory(
+                        123,
+                        "RHBA-2017",
+                        "REL_PREP",
+                        content_type,
+                        security_impact="",
+                        product_short_name="product",
+                    ),
+                    ["foo-container", "bar-container"],
+                )
+                handler = RebuildImagesOnRPMAdvisoryChange()
+                ret = handler.can_handle(event)
+                self.assertFalse(ret)
 
     @patch.object(freshmaker.conf, "dry_run", new=True)
     def test_requester_on_manual_rebuild(self):
@@ -333,23 +341,25 @@ class TestRebuildImagesOnRPMAdvisoryChange(helpers.ModelsTestCase):
         db.session.commit()
 
         for severity in ["moderate", "critical", "important"]:
-            self.rhba_event.advisory.security_impact = severity
-            self.mock_find_images_to_rebuild.return_value = [[]]
-            handler = RebuildImagesOnRPMAdvisoryChange()
-            handler.handle(self.rhba_event)
-
-            db_event = Event.get(db.session, message_id="123")
-            self.assertEqual(db_event.state, EventState.SKIPPED.value)
-            if severity == "moderate":
-                self.assertTrue(
-                    db_event.state_reason.endswith(
-                        "is not allowed by internal policy to trigger rebuilds."
+            with self.subTest(severity=severity):
+                self.rhba_event.advisory.security_impact = severity
+                self.mock_find_images_to_rebuild.return_value = [[]]
+                handler = RebuildImagesOnRPMAdvisoryChange()
+                handler.handle(self.rhba_event)
+
+                db_event = Event.get(db.session, message_id="123")
+                self.assertEqual(db_event.state, EventState.SKIPPED.value)
+                if severity == "moderate":
+                    self.assertTrue(
+                        db_event.state_reason.endswith(
+                            "is not allowed by internal policy to trigger rebuilds."
+                        )
+                    )
+                else:
+                    self.assertEqual(
+                        db_event.state_reason,
+                        "No container images to rebuild for advisory 'RHBA-2017'",
                     )
-                )
-            else:
-                self.assertEqual(
-                    db_event.state_reason, "No container images to rebuild for advisory 'RHBA-2017'"
-                )
 
     @patch.object(
         freshmaker.conf,
@@ -369,23 +379,25 @@ class TestRebuildImagesOnRPMAdvisoryChange(helpers.ModelsTestCase):
         db.session.commit()
 
         for is_major_incident in [False, True]:
-            self.rhba_event.advisory.is_major_incident = is_major_incident
-            self.mock_find_images_to_rebuild.return_value = [[]]
-            handler = RebuildImagesOnRPMAdvisoryChange()
-            handler.handle(self.rhba_event)
-
-            db_event = Event.get(db.session, message_id="123")
-            self.assertEqual(db_event.state, EventState.SKIPPED.value)
-            if not is_major_incident:
-                self.assertTrue(
-                    db_event.state_reason.endswith(
-                        "is not allowed by internal policy to trigger rebuilds."
+            with self.subTest(is_major_incident=is_major_incident):
+                self.rhba_event.advisory.is_major_incident = is_major_incident
+                self.mock_find_images_to_rebuild.return_value = [[]]
+                handler = RebuildImagesOnRPMAdvisoryChange()
+                handler.handle(self.rhba_event)
+
+                db_event = Event.get(db.session, message_id="123")
+                self.assertEqual(db_event.state, EventState.SKIPPED.value)
+                if not is_major_incident:
+                    self.assertTrue(
+                        db_event.state_reason.endswith(
+                            "is not allowed by internal policy to trigger rebuilds."
+                        )
+                    )
+                else:
+                    self.assertEqual(
+                        db_event.state_reason,
+                        "No container images to rebuild for advisory 'RHBA-2017'",
                     )
-                )
-            else:
-                self.assertEqual(
-                    db_event.state_reason, "No container images to rebuild for advisory 'RHBA-2017'"
-                )
 
     @patch.object(
         freshmaker.conf,
@@ -673,12 +685,12 @@ class TestAllowBuild(helpers.ModelsTestCase):
         "freshmaker.handlers.koji.RebuildImagesOnRPMAdvisoryChange." "_find_images_to_rebuild",
         return_value=[],
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={"RebuildImagesOnRPMAdvisoryChange": {"image": {"advisory_name": "RHSA-.*"}}},
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new=ALLOWLIST_RHSA,
     )
-    def test_allow_build_false(self, handler_build_allowlist, record_images):
+    def test_allow_build_false(self, record_images):
         """
         Tests that allow_build filters out advisories based on advisory_name.
         """
@@ -697,12 +709,12 @@ class TestAllowBuild(helpers.ModelsTestCase):
         "freshmaker.handlers.koji.RebuildImagesOnRPMAdvisoryChange." "_find_images_to_rebuild",
         return_value=[],
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={"RebuildImagesOnRPMAdvisoryChange": {"image": {"advisory_name": "RHSA-.*"}}},
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new=ALLOWLIST_RHSA,
     )
-    def test_allow_build_true(self, handler_build_allowlist, record_images):
+    def test_allow_build_true(self, record_images):
         """
         Tests that allow_build does not filter out advisories based on
         advisory_name.
@@ -723,10 +735,10 @@ class TestAllowBuild(helpers.ModelsTestCase):
         "freshmaker.handlers.koji.RebuildImagesOnRPMAdvisoryChange." "_find_images_to_rebuild",
         return_value=[],
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": {
                     "advisory_security_impact": ["Normal", "Important"],
@@ -735,7 +747,7 @@ class TestAllowBuild(helpers.ModelsTestCase):
             }
         },
     )
-    def test_allow_security_impact_important_true(self, handler_build_allowlist, record_images):
+    def test_allow_security_impact_important_true(self, record_images):
         """
         Tests that allow_build does not filter out advisories based on
         advisory_security_impact.
@@ -760,16 +772,16 @@ class TestAllowBuild(helpers.ModelsTestCase):
         "freshmaker.handlers.koji.RebuildImagesOnRPMAdvisoryChange." "_find_images_to_rebuild",
         return_value=[],
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": {"advisory_security_impact": ["Normal", "Important"]}
             }
         },
     )
-    def test_allow_security_impact_important_false(self, handler_build_allowlist, record_images):
+    def test_allow_security_impact_important_false(self, record_images):
         """
         Tests that allow_build dost filter out advisories based on
         advisory_security_impact.
@@ -794,14 +806,12 @@ class TestAllowBuild(helpers.ModelsTestCase):
         "freshmaker.handlers.koji.RebuildImagesOnRPMAdvisoryChange." "_find_images_to_rebuild",
         return_value=[],
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_blocklist",
-        new_callable=PropertyMock,
-        return_value={
-            "RebuildImagesOnRPMAdvisoryChange": {"image": {"advisory_release_name": "RHEL-7"}}
-        },
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_blocklist",
+        new={"RebuildImagesOnRPMAdvisoryChange": {"image": {"advisory_release_name": "RHEL-7"}}},
     )
-    def test_not_allow_by_advisory_release(self, handler_build_allowlist, record_images):
+    def test_not_allow_by_advisory_release(self, record_images):
         """
         Tests that allow_build does filter out advisories based on
         advisory_release_name.
@@ -823,14 +833,12 @@ class TestAllowBuild(helpers.ModelsTestCase):
 
         record_images.assert_not_called()
 
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
-            "RebuildImagesOnRPMAdvisoryChange": {"image": {"image_name": ["foo", "bar"]}}
-        },
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={"RebuildImagesOnRPMAdvisoryChange": {"image": {"image_name": ["foo", "bar"]}}},
     )
-    def test_filter_out_not_allowed_builds(self, handler_build_allowlist):
+    def test_filter_out_not_allowed_builds(self):
         """
         Tests that allow_build does filter images based on image_name.
         """
@@ -848,26 +856,21 @@ class TestAllowBuild(helpers.ModelsTestCase):
             ),
         )
 
-        image = ContainerImage({"brew": {"build": "foo-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, False)
+        for build, expected in [
+            ("foo-1-2.3", False),
+            ("foo2-1-2.3", False),
+            ("bar-1-2.3", False),
+            ("unknown-1-2.3", True),
+        ]:
+            with self.subTest(build=build):
+                image = ContainerImage({"brew": {"build": build}})
+                ret = handler._filter_out_not_allowed_builds(image)
+                self.assertEqual(ret, expected)
 
-        image = ContainerImage({"brew": {"build": "foo2-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, False)
-
-        image = ContainerImage({"brew": {"build": "bar-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, False)
-
-        image = ContainerImage({"brew": {"build": "unknown-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, True)
-
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": {
                     "image_name": ["foo", "bar"],
@@ -876,7 +879,7 @@ class TestAllowBuild(helpers.ModelsTestCase):
             }
         },
     )
-    def test_filter_out_image_name_and_advisory_name(self, handler_build_allowlist):
+    def test_filter_out_image_name_and_advisory_name(self):
         """
         Tests that allow_build does filter images based on image_name.
         """
@@ -894,25 +897,24 @@ class TestAllowBuild(helpers.ModelsTestCase):
             ),
         )
 
-        image = ContainerImage({"brew": {"build": "foo-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, False)
-
-        image = ContainerImage({"brew": {"build": "unknown-1-2.3"}})
-        ret = handler._filter_out_not_allowed_builds(image)
-        self.assertEqual(ret, True)
+        for build, expected in [
+            ("foo-1-2.3", False),
+            ("unknown-1-2.3", True),
+        ]:
+            with self.subTest(build=build):
+                image = ContainerImage({"brew": {"build": build}})
+                ret = handler._filter_out_not_allowed_builds(image)
+                self.assertEqual(ret, expected)
 
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
-            "RebuildImagesOnRPMAdvisoryChange": {"image": {"image_name": ["foo", "bar"]}}
-        },
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={"RebuildImagesOnRPMAdvisoryChange": {"image": {"image_name": ["foo", "bar"]}}},
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_blocklist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_blocklist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": all_(
                     {
@@ -923,9 +925,7 @@ class TestAllowBuild(helpers.ModelsTestCase):
             }
         },
     )
-    def test_filter_out_not_allowed_builds_image_version(
-        self, handler_build_blocklist, handler_build_allowlist
-    ):
+    def test_filter_out_not_allowed_builds_image_version(self):
         handler = RebuildImagesOnRPMAdvisoryChange()
         handler.event = ErrataRPMAdvisoryShippedEvent(
             "123",
@@ -955,19 +955,19 @@ class TestAllowBuild(helpers.ModelsTestCase):
         ret = handler._filter_out_not_allowed_builds(image)
         self.assertEqual(ret, True)
 
-    @patch(
-        "freshmaker.config.Config.handler_build_allowlist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_allowlist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": {"advisory_security_impact": ["moderate", "important"]}
             }
         },
     )
-    @patch(
-        "freshmaker.config.Config.handler_build_blocklist",
-        new_callable=PropertyMock,
-        return_value={
+    @patch.object(
+        freshmaker.conf,
+        "handler_build_blocklist",
+        new={
             "RebuildImagesOnRPMAdvisoryChange": {
                 "image": all_(
                     {
@@ -979,9 +979,7 @@ class TestAllowBuild(helpers.ModelsTestCase):
             }
         },
     )
-    def test_filter_out_not_allowed_builds_combined_repo_impact(
-        self, handler_build_blocklist, handler_build_allowlist
-    ):
+    def test_filter_out_not_allowed_builds_combined_repo_impact(self):
         """
         Tests that allow_build filters on combined published_repo,
         security_impact and major_incident criteria.
@@ -1120,10 +1118,7 @@ class TestBatches(helpers.ModelsTestCase):
         ]
 
         # Flat list of images from batches with brew build id as a key.
-        images = {}
-        for batch in batches:
-            for image in batch:
-                images[image.nvr] = image
+        images = {image.nvr: image for batch in batches for image in batch}
 
         # Record the batches.
         event = events.BrewSignRPMEvent("123", "openssl-1.1.0-1")
@@ -1131,8 +1126,15 @@ class TestBatches(helpers.ModelsTestCase):
         handler._record_batches(batches, event)
 
         # Check that the images have proper data in proper db columns.
-        e = db.session.query(Event).filter(Event.id == 1).one()
-        for build in e.builds:
+        # Eager-load dep_on - the assertions below touch it for every build
+        # and would otherwise issue one lazy-load query per row.
+        builds = (
+            db.session.query(ArtifactBuild)
+            .filter(ArtifactBuild.event_id == 1)
+            .options(joinedload(ArtifactBuild.dep_on))
+            .all()
+        )
+        for build in builds:
             # child1_parent1 and child1 are in FAILED states, because LB failed
             # to resolve child1_parent1 and therefore also child1 cannot be
             # build.
@@ -1154,12 +1156,16 @@ class TestBatches(helpers.ModelsTestCase):
                 self.assertEqual(build.rebuild_reason, RebuildReason.DEPENDENCY.value)
 
             args = json.loads(build.build_args)
-            self.assertEqual(args["repository"], build.name + "_repo")
-            self.assertEqual(args["commit"], build.name + "_123")
+            expected_args = {
+                "repository": build.name + "_repo",
+                "commit": build.name + "_123",
+                "original_parent": build.dep_on.original_nvr if build.dep_on else None,
+                "renewed_odcs_compose_ids": [10, 11],
+            }
             self.assertEqual(
-                args["original_parent"], build.dep_on.original_nvr if build.dep_on else None
+                {key: args[key] for key in expected_args},
+                expected_args,
             )
-            self.assertEqual(args["renewed_odcs_compose_ids"], [10, 11])
 
 
 class TestCheckImagesToRebuild(helpers.ModelsTestCase):
@@ -28,6 +28,8 @@ import koji
 from unittest.mock import patch, MagicMock, PropertyMock
 from functools import wraps
 
+from sqlalchemy.exc import OperationalError
+
 import freshmaker.consumer
 from freshmaker import events
 from freshmaker import db
@@ -94,13 +96,41 @@ class FreshmakerTestCase(unittest.TestCase):
         return consumer
 
 
+_db_schema_created = False
+
+
+def _reset_db():
+    """
+    Give the test a clean database.
+
+    The schema is created only once per test session - re-running the DDL
+    for every test dominated setUp time. Subsequent tests just delete all
+    rows, which is much cheaper on the in-memory SQLite the test config
+    uses.
+    """
+    global _db_schema_created
+    db.session.remove()
+    if _db_schema_created:
+        try:
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
+            return
+        except OperationalError:
+            # A test invalidated the connection to the in-memory SQLite
+            # database, taking the schema with it - rebuild from scratch.
+            db.session.rollback()
+            db.session.remove()
+    # No commit needed here - DDL autocommits.
+    db.drop_all()
+    db.create_all()
+    _db_schema_created = True
+
+
 class ModelsTestCase(FreshmakerTestCase):
     def setUp(self):
         super(ModelsTestCase, self).setUp()
-        db.session.remove()
-        db.drop_all()
-        db.create_all()
-        db.session.commit()
+        _reset_db()
 
         self.user = User(username="tester1")
         db.session.add(self.user)
@@ -108,10 +138,7 @@ class ModelsTestCase(FreshmakerTestCase):
 
     def tearDown(self):
         super(ModelsTestCase, self).tearDown()
-
         db.session.remove()
-        db.drop_all()
-        db.session.commit()
 
 
 class MockedKoji(object):
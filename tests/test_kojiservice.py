@@ -25,11 +25,8 @@ from unittest import mock
 from freshmaker import kojiservice  # noqa E402
 
 
-@mock.patch("freshmaker.kojiservice.koji")
-def test_build_container_csv_mods(mock_koji):
-    mock_session = mock.Mock()
-    mock_session.buildContainer.return_value = 123
-    mock_koji.ClientSession.return_value = mock_session
+def test_build_container_csv_mods(koji_session):
+    koji_session.buildContainer.return_value = 123
 
     svc = kojiservice.KojiService()
     svc.build_container(
@@ -39,7 +36,7 @@ def test_build_container_csv_mods(mock_koji):
         operator_csv_modifications_url="https://domain.local/namespace/repo",
     )
 
-    mock_session.buildContainer.assert_called_once_with(
+    koji_session.buildContainer.assert_called_once_with(
         "git@domain.local:namespace/repo.git",
         "repo-1.0",
         {
@@ -50,10 +47,8 @@ def test_build_container_csv_mods(mock_koji):
     )
 
 
-@mock.patch("freshmaker.kojiservice.koji")
-def test_get_ocp_versions_range(mock_koji):
-    mock_session = mock.Mock()
-    mock_session.getBuild.return_value = {"id": 123}
+def test_get_ocp_versions_range(koji_session):
+    koji_session.getBuild.return_value = {"id": 123}
     archives = [
         {
             "arch": "x86_64",
@@ -82,26 +77,22 @@ def test_get_ocp_versions_range(mock_koji):
         }
     ]
 
-    mock_session.listArchives.return_value = archives
-    mock_koji.ClientSession.return_value = mock_session
+    koji_session.listArchives.return_value = archives
 
     svc = kojiservice.KojiService()
     assert svc.get_ocp_versions_range("foobar-2-123") == "v4.5,v4.6"
 
 
-@mock.patch("freshmaker.kojiservice.koji")
 @mock.patch("freshmaker.kojiservice.requests.get")
 @mock.patch("freshmaker.kojiservice.ZipFile")
 @mock.patch("freshmaker.kojiservice.BytesIO")
 @mock.patch("freshmaker.kojiservice.yaml")
-def test_get_bundle_csv_success(mock_yaml, mock_bytesio, mock_zipfile, mock_get, mock_koji):
-    mock_session = mock.Mock()
-    mock_session.getBuild.return_value = {
+def test_get_bundle_csv_success(mock_yaml, mock_bytesio, mock_zipfile, mock_get, koji_session):
+    koji_session.getBuild.return_value = {
         "id": 123,
         "nvr": "foobar-bundle-container-2.0-123",
         "extra": {"operator_manifests_archive": "operator_manifests.zip"},
     }
-    mock_koji.ClientSession.return_value = mock_session
     mock_get.return_value = mock.Mock(ok=True)
     mock_zipfile.return_value.namelist.return_value = [
         "foobar-v2.0-opr-1.clusterserviceversion.yaml",
@@ -122,21 +113,18 @@ def test_get_bundle_csv_success(mock_yaml, mock_bytesio, mock_zipfile, mock_get,
     assert csv["spec"]["version"] == "2.0-opr-1"
 
 
-@mock.patch("freshmaker.kojiservice.koji")
 @mock.patch("freshmaker.kojiservice.requests.get")
 @mock.patch("freshmaker.kojiservice.ZipFile")
 @mock.patch("freshmaker.kojiservice.BytesIO")
 @mock.patch("freshmaker.kojiservice.yaml")
 def test_get_bundle_csv_from_csv_dot_yaml(
-    mock_yaml, mock_bytesio, mock_zipfile, mock_get, mock_koji
+    mock_yaml, mock_bytesio, mock_zipfile, mock_get, koji_session
 ):
-    mock_session = mock.Mock()
-    mock_session.getBuild.return_value = {
+    koji_session.getBuild.return_value = {
         "id": 123,
         "nvr": "foobar-bundle-container-2.0-123",
         "extra": {"operator_manifests_archive": "operator_manifests.zip"},
     }
-    mock_koji.ClientSession.return_value = mock_session
     mock_get.return_value = mock.Mock(ok=True)
     mock_zipfile.return_value.namelist.return_value = [
         "foobar-v2.0-opr-1.csv.yaml",
@@ -158,16 +146,13 @@ def test_get_bundle_csv_from_csv_dot_yaml(
 
 
 @mock.patch("freshmaker.kojiservice.log")
-@mock.patch("freshmaker.kojiservice.koji")
 @mock.patch("freshmaker.kojiservice.requests.get")
-def test_get_bundle_csv_unavailable(mock_get, mock_koji, mock_log):
-    mock_session = mock.Mock()
-    mock_session.getBuild.return_value = {
+def test_get_bundle_csv_unavailable(mock_get, mock_log, koji_session):
+    koji_session.getBuild.return_value = {
         "id": 123,
         "nvr": "foobar-bundle-container-2.0-123",
         "extra": {},
     }
-    mock_koji.ClientSession.return_value = mock_session
 
     svc = kojiservice.KojiService()
     csv = svc.get_bundle_csv("foobar-bundle-container-2.0-123")
@@ -178,9 +163,7 @@ def test_get_bundle_csv_unavailable(mock_get, mock_koji, mock_log):
     )
 
 
-@mock.patch("freshmaker.kojiservice.koji")
-def test_get_modulemd(mock_koji):
-    mock_session = mock.Mock()
+def test_get_modulemd(koji_session):
     build = {
         "build_id": 1850907,
         "epoch": None,
@@ -204,9 +187,7 @@ def test_get_modulemd(mock_koji):
         "package_name": "ghc",
     }
 
-    mock_session.getBuild.return_value = build
-
-    mock_koji.ClientSession.return_value = mock_session
+    koji_session.getBuild.return_value = build
 
     svc = kojiservice.KojiService()
     mmd = svc.get_modulemd("ghc-9.2-3620211101111632.d099bf28")
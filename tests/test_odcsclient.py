@@ -82,6 +82,12 @@ class TestCreateODCSClient(helpers.FreshmakerTestCase):
         self.assertRaisesRegex(ValueError, r"Missing OpenIDC token.*", create_odcs_client)
 
 
+EXPECTED_PACKAGES = frozenset({"chkconfig", "chkconfig-debuginfo"})
+
+HTTPD_SRPM_NVRS = frozenset({"httpd-2.4.15-1.f27"})
+FOO_SRPM_NVRS = frozenset({"foo-2.4.15-1.f27"})
+
+
 class TestGetPackagesForCompose(helpers.FreshmakerTestCase):
     """Test MyHandler._get_packages_for_compose"""
 
@@ -94,7 +100,7 @@ class TestGetPackagesForCompose(helpers.FreshmakerTestCase):
         handler = MyHandler()
         packages = handler.odcs._get_packages_for_compose(build_nvr)
 
-        self.assertEqual(set(["chkconfig", "chkconfig-debuginfo"]), set(packages))
+        self.assertEqual(EXPECTED_PACKAGES, frozenset(packages))
 
 
 class TestGetComposeSource(helpers.FreshmakerTestCase):
@@ -143,17 +149,29 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
         )
         db.session.commit()
 
-    @patch("freshmaker.odcsclient.create_odcs_client")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_packages_for_compose")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_compose_source")
-    @patch("time.sleep")
-    @patch("freshmaker.odcsclient.Errata")
-    def test_get_repo_url_when_succeed_to_generate_compose(
-        self, errata, sleep, _get_compose_source, _get_packages_for_compose, create_odcs_client
-    ):
-        odcs = create_odcs_client.return_value
-        _get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
-        _get_compose_source.return_value = "rhel-7.2-candidate"
+        # All tests in this class stack the same five patches; apply them
+        # once here instead of repeating the decorator pile per test.
+        self.patcher = helpers.Patcher()
+        self.mock_create_odcs_client = self.patcher.patch(
+            "freshmaker.odcsclient.create_odcs_client"
+        )
+        self.mock_get_packages_for_compose = self.patcher.patch(
+            "freshmaker.odcsclient.FreshmakerODCSClient._get_packages_for_compose"
+        )
+        self.mock_get_compose_source = self.patcher.patch(
+            "freshmaker.odcsclient.FreshmakerODCSClient._get_compose_source"
+        )
+        self.mock_sleep = self.patcher.patch("time.sleep")
+        self.mock_errata = self.patcher.patch("freshmaker.odcsclient.Errata")
+
+    def tearDown(self):
+        super(TestPrepareYumRepo, self).tearDown()
+        self.patcher.unpatch_all()
+
+    def test_get_repo_url_when_succeed_to_generate_compose(self):
+        odcs = self.mock_create_odcs_client.return_value
+        self.mock_get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
+        self.mock_get_compose_source.return_value = "rhel-7.2-candidate"
         odcs.new_compose.return_value = {
             "id": 3,
             "result_repo": "http://localhost/composes/latest-odcs-3-1/compose/Temporary",
@@ -164,7 +182,7 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
             "state_name": "wait",
         }
 
-        errata.return_value.get_srpm_nvrs.return_value = set(["httpd-2.4.15-1.f27"])
+        self.mock_errata.return_value.get_srpm_nvrs.return_value = HTTPD_SRPM_NVRS
 
         handler = MyHandler()
         compose = handler.odcs.prepare_yum_repo(self.ev)
@@ -172,15 +190,15 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
         db.session.refresh(self.ev)
         self.assertEqual(3, compose["id"])
 
-        _get_compose_source.assert_called_once_with("httpd-2.4.15-1.f27")
-        _get_packages_for_compose.assert_called_once_with("httpd-2.4.15-1.f27")
+        self.mock_get_compose_source.assert_called_once_with("httpd-2.4.15-1.f27")
+        self.mock_get_packages_for_compose.assert_called_once_with("httpd-2.4.15-1.f27")
 
         # Ensure new_compose is called to request a new compose
         odcs.new_compose.assert_called_once_with(
             "rhel-7.2-candidate",
             "tag",
             packages=["httpd", "httpd-debuginfo"],
-            sigkeys=[],
+            sigkeys=(),
             flags=["no_deps"],
         )
 
@@ -190,26 +208,19 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
             compose["result_repofile"],
         )
 
-    @patch("freshmaker.odcsclient.create_odcs_client")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_packages_for_compose")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_compose_source")
-    @patch("time.sleep")
-    @patch("freshmaker.odcsclient.Errata")
-    def test_get_repo_url_packages_in_multiple_tags(
-        self, errata, sleep, _get_compose_source, _get_packages_for_compose, create_odcs_client
-    ):
-        _get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
-        _get_compose_source.side_effect = ["rhel-7.2-candidate", "rhel-7.7-candidate"]
-
-        errata.return_value.get_srpm_nvrs.return_value = [
-            set(["httpd-2.4.15-1.f27"]),
-            set(["foo-2.4.15-1.f27"]),
+    def test_get_repo_url_packages_in_multiple_tags(self):
+        self.mock_get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
+        self.mock_get_compose_source.side_effect = ["rhel-7.2-candidate", "rhel-7.7-candidate"]
+
+        self.mock_errata.return_value.get_srpm_nvrs.return_value = [
+            HTTPD_SRPM_NVRS,
+            FOO_SRPM_NVRS,
         ]
 
         handler = MyHandler()
         repo_url = handler.odcs.prepare_yum_repo(self.ev)
 
-        create_odcs_client.return_value.new_compose.assert_not_called()
+        self.mock_create_odcs_client.return_value.new_compose.assert_not_called()
         self.assertEqual(repo_url, None)
 
         db.session.refresh(self.ev)
@@ -220,26 +231,19 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
                 "Packages for errata " "advisory 123 found in multiple different tags.",
             )
 
-    @patch("freshmaker.odcsclient.create_odcs_client")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_packages_for_compose")
-    @patch("freshmaker.odcsclient.FreshmakerODCSClient._get_compose_source")
-    @patch("time.sleep")
-    @patch("freshmaker.odcsclient.Errata")
-    def test_get_repo_url_packages_not_found_in_tag(
-        self, errata, sleep, _get_compose_source, _get_packages_for_compose, create_odcs_client
-    ):
-        _get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
-        _get_compose_source.return_value = None
-
-        errata.return_value.get_srpm_nvrs.return_value = [
-            set(["httpd-2.4.15-1.f27"]),
-            set(["foo-2.4.15-1.f27"]),
+    def test_get_repo_url_packages_not_found_in_tag(self):
+        self.mock_get_packages_for_compose.return_value = ["httpd", "httpd-debuginfo"]
+        self.mock_get_compose_source.return_value = None
+
+        self.mock_errata.return_value.get_srpm_nvrs.return_value = [
+            HTTPD_SRPM_NVRS,
+            FOO_SRPM_NVRS,
         ]
 
         handler = MyHandler()
         repo_url = handler.odcs.prepare_yum_repo(self.ev)
 
-        create_odcs_client.return_value.new_compose.assert_not_called()
+        self.mock_create_odcs_client.return_value.new_compose.assert_not_called()
         self.assertEqual(repo_url, None)
 
         db.session.refresh(self.ev)
@@ -289,8 +293,7 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
         )
 
     @patch("freshmaker.odcsclient.create_odcs_client")
-    @patch("time.sleep")
-    def test_prepare_odcs_compose_with_image_rpms(self, sleep, create_odcs_client):
+    def test_prepare_odcs_compose_with_image_rpms(self, create_odcs_client):
         odcs = create_odcs_client.return_value
         odcs.new_compose.return_value = {
             "id": 3,
@@ -317,13 +320,12 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
             builds=["apache-commons-lang-2.6-15.el7", "avalon-logkit-2.1-14.el7"],
             flags=["no_deps"],
             packages=["apache-commons-lang", "avalon-logkit"],
-            sigkeys=[],
+            sigkeys=(),
             arches=["x86_64"],
         )
 
     @patch("freshmaker.odcsclient.create_odcs_client")
-    @patch("time.sleep")
-    def test_prepare_odcs_compose_with_multi_arch_image_rpms(self, sleep, create_odcs_client):
+    def test_prepare_odcs_compose_with_multi_arch_image_rpms(self, create_odcs_client):
         odcs = create_odcs_client.return_value
         odcs.new_compose.return_value = {
             "id": 3,
@@ -354,7 +356,7 @@ class TestPrepareYumRepo(helpers.ModelsTestCase):
                 builds=["apache-commons-lang-2.6-15.el7", "avalon-logkit-2.1-14.el7"],
                 flags=["no_deps"],
                 packages=["apache-commons-lang", "avalon-logkit"],
-                sigkeys=[],
+                sigkeys=(),
                 arches=["s390x", "x86_64"],
             )
 
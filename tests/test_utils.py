@@ -88,6 +88,39 @@ class TestSortedByNVR(helpers.FreshmakerTestCase):
         ret = sorted_by_nvr(lst, reverse=True)
         self.assertEqual(ret, list(reversed(expected)))
 
+    def test_matches_compare_nvr_ordering(self):
+        import functools
+
+        import kobo.rpmlib
+
+        def _compare(nvr1, nvr2):
+            parsed1 = kobo.rpmlib.parse_nvr(nvr1)
+            parsed2 = kobo.rpmlib.parse_nvr(nvr2)
+            if parsed1["name"] != parsed2["name"]:
+                return (parsed1["name"] > parsed2["name"]) - (parsed1["name"] < parsed2["name"])
+            return kobo.rpmlib.compare_nvr(parsed1, parsed2)
+
+        corpus = [
+            "foo-1-1",
+            "foo-1-2",
+            "foo-1-10",
+            "foo-1.0-1",
+            "foo-1.0.1-1",
+            "foo-1.0-0.1",
+            "foo-1.0-0.rc1",
+            "foo-1.0-1.b",
+            "foo-1.0a-1",
+            "foo-1.a-1",
+            "foo-1.1-1",
+            "foo-2-1",
+            "foo-2:1-1",
+            "bar-1-1",
+            "httpd-2.4.15-1.f27",
+        ]
+        lst = list(reversed(corpus))
+        expected = sorted(lst, key=functools.cmp_to_key(_compare))
+        self.assertEqual(sorted_by_nvr(lst), expected)
+
 
 class TestLoadRemoteYaml(TestCase):
     @patch("requests.get")
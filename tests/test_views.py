@@ -44,6 +44,13 @@ def user_loader(username):
 
 
 class ViewBaseTest(helpers.ModelsTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(ViewBaseTest, cls).setUpClass()
+        # The test client keeps no per-test state, so build it once for
+        # the whole class instead of in every setUp.
+        cls.client = app.test_client()
+
     def setUp(self):
         super(ViewBaseTest, self).setUp()
         patched_permissions = defaultdict(lambda: {"groups": [], "users": []})
@@ -59,8 +66,6 @@ class ViewBaseTest(helpers.ModelsTestCase):
         )
         self.patch_oidc_base_namespace.start()
 
-        self.client = app.test_client()
-
         self.setup_test_data()
 
     def tearDown(self):
@@ -116,46 +121,88 @@ class ViewBaseTest(helpers.ModelsTestCase):
 
 
 class TestViews(helpers.ModelsTestCase):
+    # Event type ids looked up once instead of on every request URL built
+    # in the tests below.
+    ETID_TEST = models.EVENT_TYPES[events.TestingEvent]
+    ETID_GIT = models.EVENT_TYPES[events.GitModuleMetadataChangeEvent]
+    ETID_MBS = models.EVENT_TYPES[events.MBSModuleStateChangeEvent]
+    ETID_KOJI = models.EVENT_TYPES[events.KojiTaskStateChangeEvent]
+
+    URL_BUILDS_EV_TESTING = f"/api/1/builds/?event_type_id={ETID_TEST}"
+    URL_BUILDS_EV_GIT = f"/api/1/builds/?event_type_id={ETID_GIT}"
+    URL_BUILDS_EV_MBS = f"/api/1/builds/?event_type_id={ETID_MBS}"
+    URL_BUILDS_EV_KOJI = f"/api/1/builds/?event_type_id={ETID_KOJI}"
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestViews, cls).setUpClass()
+        cls.client = app.test_client()
+
     def setUp(self):
         super(TestViews, self).setUp()
         self._init_data()
 
-        self.client = app.test_client()
-
     def _init_data(self):
-        event = models.Event.create(
-            db.session, "2017-00000000-0000-0000-0000-000000000001", "101", events.TestingEvent
-        )
-        build = models.ArtifactBuild.create(db.session, event, "ed", "module", 1234)
-        build.build_args = '{"key": "value"}'
-        models.ArtifactBuild.create(db.session, event, "mksh", "module", 1235)
-        models.ArtifactBuild.create(db.session, event, "bash", "module", 1236)
-        models.Event.create(
-            db.session, "2017-00000000-0000-0000-0000-000000000002", "102", events.TestingEvent
-        )
+        # The tests only read this fixture data back through the API, so
+        # insert it with two executemany statements instead of five ORM
+        # instances going through the unit of work one by one.
+        now = datetime.datetime.utcnow()
+        event_rows = [
+            {
+                "message_id": "2017-00000000-0000-0000-0000-00000000000%d" % index,
+                "search_key": search_key,
+                "event_type_id": self.ETID_TEST,
+                "released": True,
+                "state": EventState.INITIALIZED.value,
+                "time_created": now,
+                "manual_triggered": False,
+                "dry_run": False,
+            }
+            for index, search_key in [(1, "101"), (2, "102")]
+        ]
+        db.session.bulk_insert_mappings(models.Event, event_rows)
+        build_rows = [
+            {
+                "event_id": 1,
+                "name": name,
+                "type": ArtifactType.MODULE.value,
+                "state": ArtifactBuildState.BUILD.value,
+                "build_id": build_id,
+                "time_submitted": now,
+                "rebuild_reason": 0,
+                "build_args": build_args,
+            }
+            for name, build_id, build_args in [
+                ("ed", 1234, '{"key": "value"}'),
+                ("mksh", 1235, None),
+                ("bash", 1236, None),
+            ]
+        ]
+        db.session.bulk_insert_mappings(models.ArtifactBuild, build_rows)
         db.session.commit()
-        db.session.expire_all()
+
+    EXPECTED_BUILD_1 = {
+        "id": 1,
+        "name": "ed",
+        "type": ArtifactType.MODULE.value,
+        "state": ArtifactBuildState.BUILD.value,
+        "event_id": 1,
+        "build_id": 1234,
+        "build_args": {"key": "value"},
+        "rebuild_reason": "unknown",
+    }
 
     def test_query_build(self):
-        resp = self.client.get("/api/1/builds/1")
-        data = resp.json
-        self.assertEqual(data["id"], 1)
-        self.assertEqual(data["name"], "ed")
-        self.assertEqual(data["type"], ArtifactType.MODULE.value)
-        self.assertEqual(data["state"], ArtifactBuildState.BUILD.value)
-        self.assertEqual(data["event_id"], 1)
-        self.assertEqual(data["build_id"], 1234)
-        self.assertEqual(data["build_args"], {"key": "value"})
-        self.assertEqual(data["rebuild_reason"], "unknown")
+        data = self.client.get("/api/1/builds/1").json
+        self.assertEqual({k: data[k] for k in self.EXPECTED_BUILD_1}, self.EXPECTED_BUILD_1)
 
     def test_query_builds(self):
-        resp = self.client.get("/api/1/builds/")
+        resp = self.client.get("/api/1/builds/?order_by=name")
         builds = resp.json["items"]
-        self.assertEqual(len(builds), 3)
-        for name in ["ed", "mksh", "bash"]:
-            self.assertIn(name, [b["name"] for b in builds])
-        for build_id in [1234, 1235, 1236]:
-            self.assertIn(build_id, [b["build_id"] for b in builds])
+        self.assertEqual(
+            [(b["name"], b["build_id"]) for b in builds],
+            [("bash", 1236), ("ed", 1234), ("mksh", 1235)],
+        )
 
     def test_query_builds_order_by_default(self):
         event = models.Event.create(
@@ -217,37 +264,70 @@ class TestViews(helpers.ModelsTestCase):
             data["message"].startswith("An invalid order_by key was suplied, allowed keys are")
         )
 
-    def test_query_builds_by_name(self):
-        resp = self.client.get("/api/1/builds/?name=ed")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 1)
-        self.assertEqual(builds[0]["name"], "ed")
-
-        resp = self.client.get("/api/1/builds/?name=mksh")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 1)
-        self.assertEqual(builds[0]["name"], "mksh")
-
-        resp = self.client.get("/api/1/builds/?name=nonexist")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 0)
-
-    def test_query_builds_by_type(self):
-        resp = self.client.get("/api/1/builds/?type=0")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 0)
-
-        resp = self.client.get("/api/1/builds/?type=1")
+    # Read-only filter queries against the fixture data created by
+    # _init_data(). They are checked in a single test method below, so the
+    # fixture setup and test client are paid for once instead of once per
+    # query. Each entry is (url, expected number of items, fields expected
+    # on the first item).
+    READ_ONLY_QUERY_CASES = [
+        ("/api/1/builds/?name=ed", 1, {"name": "ed"}),
+        ("/api/1/builds/?name=nonexist", 0, None),
+        ("/api/1/builds/?name__in=ed,mksh,nonexist", 2, None),
+        ("/api/1/builds/?type=0", 0, None),
+        ("/api/1/builds/?type=1", 0, None),
+        ("/api/1/builds/?type=2", 3, None),
+        ("/api/1/builds/?type=module", 3, None),
+        ("/api/1/builds/?state=0", 3, None),
+        ("/api/1/builds/?event_search_key=101", 3, None),
+        ("/api/1/builds/?event_search_key=102", 0, None),
+        (f"/api/1/builds/?event_type_id={ETID_TEST}&event_search_key=101", 3, None),
+        (f"/api/1/builds/?event_type_id={ETID_TEST}&event_search_key=102", 0, None),
+        ("/api/1/events/", 2, None),
+        (
+            "/api/1/events/?message_id=2017-00000000-0000-0000-0000-000000000001",
+            1,
+            {"message_id": "2017-00000000-0000-0000-0000-000000000001"},
+        ),
+        ("/api/1/events/?search_key=101", 1, {"search_key": "101"}),
+    ]
+
+    def test_read_only_queries(self):
+        for url, expected_len, expected_fields in self.READ_ONLY_QUERY_CASES:
+            with self.subTest(url=url):
+                items = self.client.get(url).json["items"]
+                self.assertEqual(len(items), expected_len)
+                for key, value in (expected_fields or {}).items():
+                    self.assertEqual(items[0][key], value)
+
+    def test_query_builds_by_name_in(self):
+        resp = self.client.get("/api/1/builds/?name__in=ed,mksh,nonexist")
+        self.assertEqual({b["name"] for b in resp.json["items"]}, {"ed", "mksh"})
+
+    def test_query_builds_fields(self):
+        resp = self.client.get("/api/1/builds/?fields=id,name")
         builds = resp.json["items"]
-        self.assertEqual(len(builds), 0)
+        self.assertEqual(len(builds), 3)
+        for build in builds:
+            self.assertEqual(sorted(build.keys()), ["id", "name"])
 
-        resp = self.client.get("/api/1/builds/?type=2")
+    def test_query_builds_fields_datetime_format(self):
+        resp = self.client.get("/api/1/builds/?fields=id,time_submitted")
+        full = self.client.get("/api/1/builds/1").json
         builds = resp.json["items"]
         self.assertEqual(len(builds), 3)
+        # The projected column must serialize exactly like the ORM path.
+        self.assertEqual(builds[-1]["time_submitted"], full["time_submitted"])
 
-        resp = self.client.get("/api/1/builds/?type=module")
+    def test_query_builds_invalid_fields(self):
+        resp = self.client.get("/api/1/builds/?fields=id,nonexist")
+        data = resp.json
+        self.assertEqual(data["status"], 400)
+        self.assertEqual(data["message"], "An invalid fields value was supplied: nonexist")
+
+    def test_query_builds_since_id(self):
+        resp = self.client.get("/api/1/builds/?since_id=1&order_by=id")
         builds = resp.json["items"]
-        self.assertEqual(len(builds), 3)
+        self.assertEqual([b["id"] for b in builds], [2, 3])
 
     def test_query_builds_by_invalid_type(self):
         resp = self.client.get("/api/1/builds/?type=100")
@@ -255,11 +335,6 @@ class TestViews(helpers.ModelsTestCase):
         self.assertEqual(data["status"], 400)
         self.assertEqual(data["message"], "An invalid artifact type was supplied")
 
-    def test_query_builds_by_state(self):
-        resp = self.client.get("/api/1/builds/?state=0")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 3)
-
     def test_query_builds_by_invalid_state(self):
         resp = self.client.get("/api/1/builds/?state=100")
         data = resp.json
@@ -291,52 +366,19 @@ class TestViews(helpers.ModelsTestCase):
         models.ArtifactBuild.create(db.session, event3, "testmodule3", "module", 2347, build1)
         db.session.commit()
 
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s" % models.EVENT_TYPES[events.TestingEvent]
-        )
+        resp = self.client.get(self.URL_BUILDS_EV_TESTING)
         builds = resp.json["items"]
         self.assertEqual(len(builds), 3)
 
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s"
-            % models.EVENT_TYPES[events.GitModuleMetadataChangeEvent]
-        )
+        resp = self.client.get(self.URL_BUILDS_EV_GIT)
         builds = resp.json["items"]
         self.assertEqual(len(builds), 2)
 
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s" % models.EVENT_TYPES[events.MBSModuleStateChangeEvent]
-        )
+        resp = self.client.get(self.URL_BUILDS_EV_MBS)
         builds = resp.json["items"]
         self.assertEqual(len(builds), 1)
 
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s" % models.EVENT_TYPES[events.KojiTaskStateChangeEvent]
-        )
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 0)
-
-    def test_query_build_by_event_search_key(self):
-        resp = self.client.get("/api/1/builds/?event_search_key=101")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 3)
-
-        resp = self.client.get("/api/1/builds/?event_search_key=102")
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 0)
-
-    def test_query_build_by_event_type_id_and_search_key(self):
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s&event_search_key=101"
-            % models.EVENT_TYPES[events.TestingEvent]
-        )
-        builds = resp.json["items"]
-        self.assertEqual(len(builds), 3)
-
-        resp = self.client.get(
-            "/api/1/builds/?event_type_id=%s&event_search_key=102"
-            % models.EVENT_TYPES[events.TestingEvent]
-        )
+        resp = self.client.get(self.URL_BUILDS_EV_KOJI)
         builds = resp.json["items"]
         self.assertEqual(len(builds), 0)
 
@@ -366,13 +408,16 @@ class TestViews(helpers.ModelsTestCase):
         self.assertTrue(meta["prev"] is None)
         self.assertTrue(meta["next"] is None)
 
+    EXPECTED_EVENT_1 = {
+        "id": 1,
+        "message_id": "2017-00000000-0000-0000-0000-000000000001",
+        "search_key": "101",
+        "event_type_id": ETID_TEST,
+    }
+
     def test_query_event(self):
-        resp = self.client.get("/api/1/events/1")
-        data = resp.json
-        self.assertEqual(data["id"], 1)
-        self.assertEqual(data["message_id"], "2017-00000000-0000-0000-0000-000000000001")
-        self.assertEqual(data["search_key"], "101")
-        self.assertEqual(data["event_type_id"], models.EVENT_TYPES[events.TestingEvent])
+        data = self.client.get("/api/1/events/1").json
+        self.assertEqual({k: data[k] for k in self.EXPECTED_EVENT_1}, self.EXPECTED_EVENT_1)
         self.assertEqual(len(data["builds"]), 3)
 
     def test_query_event_without_builds(self):
@@ -399,11 +444,6 @@ class TestViews(helpers.ModelsTestCase):
         self.assertEqual(data["id"], 2)
         self.assertRaises(KeyError, lambda: data["builds"])
 
-    def test_query_events(self):
-        resp = self.client.get("/api/1/events/")
-        evs = resp.json["items"]
-        self.assertEqual(len(evs), 2)
-
     def test_query_event_complete(self):
         event = db.session.query(models.Event).get(1)
         with patch("freshmaker.models.datetime") as datetime_patch:
@@ -413,20 +453,6 @@ class TestViews(helpers.ModelsTestCase):
         data = resp.json
         self.assertEqual(data["time_done"], "2099-08-21T13:42:20Z")
 
-    def test_query_event_by_message_id(self):
-        resp = self.client.get(
-            "/api/1/events/?message_id=2017-00000000-0000-0000-0000-000000000001"
-        )
-        evs = resp.json["items"]
-        self.assertEqual(len(evs), 1)
-        self.assertEqual(evs[0]["message_id"], "2017-00000000-0000-0000-0000-000000000001")
-
-    def test_query_event_by_search_key(self):
-        resp = self.client.get("/api/1/events/?search_key=101")
-        evs = resp.json["items"]
-        self.assertEqual(len(evs), 1)
-        self.assertEqual(evs[0]["search_key"], "101")
-
     def test_query_event_by_state_name(self):
         models.Event.create(
             db.session,
@@ -673,7 +699,7 @@ class TestViews(helpers.ModelsTestCase):
 
         resp = self.client.get(f"/api/1/pullspec_overrides/{build.id}")
 
-        self.assertEqual(json.loads(resp.data), expected_pullspecs)
+        self.assertEqual(resp.get_json(), expected_pullspecs)
 
     def test_query_nonexist_pullspec_overrides(self):
         resp = self.client.get("/api/1/pullspec_overrides/123")
@@ -759,38 +785,58 @@ class TestViews(helpers.ModelsTestCase):
 
 
 class TestViewsMultipleFilterValues(helpers.ModelsTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestViewsMultipleFilterValues, cls).setUpClass()
+        cls.client = app.test_client()
+
     def setUp(self):
         super(TestViewsMultipleFilterValues, self).setUp()
 
         self._init_data()
 
-        self.client = app.test_client()
-
     def _init_data(self):
-        event = models.Event.create(
-            db.session, "2017-00000000-0000-0000-0000-000000000001", "101", events.TestingEvent
-        )
-        event.state = EventState.BUILDING.value
-        build = models.ArtifactBuild.create(db.session, event, "ed", "module", 1234)
-        build.build_args = '{"key": "value"}'
-        models.ArtifactBuild.create(db.session, event, "mksh", "module", 1235)
-        models.ArtifactBuild.create(db.session, event, "bash", "module", 1236)
-        event2 = models.Event.create(
-            db.session,
-            "2017-00000000-0000-0000-0000-000000000002",
-            "102",
-            events.GitModuleMetadataChangeEvent,
-        )
-        event2.state = EventState.SKIPPED.value
-        event3 = models.Event.create(
-            db.session,
-            "2017-00000000-0000-0000-0000-000000000003",
-            "103",
-            events.MBSModuleStateChangeEvent,
-        )
-        event3.state = EventState.FAILED.value
+        # The tests only read this fixture back through the API, so insert
+        # it with two executemany statements instead of six ORM instances
+        # going through the unit of work one by one.
+        now = datetime.datetime.utcnow()
+        event_rows = [
+            {
+                "message_id": "2017-00000000-0000-0000-0000-00000000000%d" % index,
+                "search_key": search_key,
+                "event_type_id": models.EVENT_TYPES[event_type],
+                "released": True,
+                "state": state.value,
+                "time_created": now,
+                "manual_triggered": False,
+                "dry_run": False,
+            }
+            for index, search_key, event_type, state in [
+                (1, "101", events.TestingEvent, EventState.BUILDING),
+                (2, "102", events.GitModuleMetadataChangeEvent, EventState.SKIPPED),
+                (3, "103", events.MBSModuleStateChangeEvent, EventState.FAILED),
+            ]
+        ]
+        db.session.bulk_insert_mappings(models.Event, event_rows)
+        build_rows = [
+            {
+                "event_id": 1,
+                "name": name,
+                "type": ArtifactType.MODULE.value,
+                "state": ArtifactBuildState.BUILD.value,
+                "build_id": build_id,
+                "time_submitted": now,
+                "rebuild_reason": 0,
+                "build_args": build_args,
+            }
+            for name, build_id, build_args in [
+                ("ed", 1234, '{"key": "value"}'),
+                ("mksh", 1235, None),
+                ("bash", 1236, None),
+            ]
+        ]
+        db.session.bulk_insert_mappings(models.ArtifactBuild, build_rows)
         db.session.commit()
-        db.session.expire_all()
 
     def test_query_event_multiple_states(self):
         resp = self.client.get(
@@ -813,10 +859,6 @@ class TestViewsMultipleFilterValues(helpers.ModelsTestCase):
 
 
 class TestManualTriggerRebuild(ViewBaseTest):
-    def setUp(self):
-        super(TestManualTriggerRebuild, self).setUp()
-        self.client = app.test_client()
-
     @patch("freshmaker.messaging.publish")
     @patch("freshmaker.parsers.internal.manual_rebuild.ErrataAdvisory." "from_advisory_id")
     @patch("freshmaker.parsers.internal.manual_rebuild.time.time")
@@ -1240,10 +1282,6 @@ class TestManualTriggerRebuild(ViewBaseTest):
 
 
 class TestAsyncBuild(ViewBaseTest):
-    def setUp(self):
-        super(TestAsyncBuild, self).setUp()
-        self.client = app.test_client()
-
     @patch("freshmaker.messaging.publish")
     @patch("freshmaker.parsers.koji.async_manual_build.time.time")
     def test_async_build(self, time, publish):
@@ -1258,7 +1296,7 @@ class TestAsyncBuild(ViewBaseTest):
                     data=json.dumps(payload),
                     content_type="application/json",
                 )
-        data = json.loads(resp.get_data(as_text=True))
+        data = resp.get_json()
 
         self.assertEqual(
             data,
@@ -1308,7 +1346,7 @@ class TestAsyncBuild(ViewBaseTest):
                 "/api/1/async-builds/", json=payload, content_type="application/json"
             )
 
-        data = json.loads(resp.get_data(as_text=True))
+        data = resp.get_json()
 
         self.assertEqual(data["dry_run"], True)
         publish.assert_called_once_with(